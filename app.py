@@ -3,29 +3,33 @@ SmolSTT - Global push-to-talk Speech-to-Text via Whisper FastAPI
 Run: python app.py
 """
 
+import ctypes
+import logging
+import math
 import os
+import queue
 import sys
 import threading
 import time
-import traceback
 import faulthandler
 import tempfile
 import io
 import wave
 import subprocess
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import keyboard as kb
 import numpy as np
-import pyautogui
-import pyperclip
 import sounddevice as sd
 
 # Make src/ importable without a package prefix
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
 
 from api_client import WhisperClient
+from audio_kernels import fold_max_abs, level_stats_int16, rms_int16, warmup as warmup_audio_kernels
 from autostart import set_autostart, is_autostart_enabled
+from capture_buffer import CaptureBuffer
 from local_inference import LocalInferenceEngine, is_parakeet_model, is_whisper_model, _no_window_kwargs
 from hotkey_manager import HotkeyManager
 from logger import log
@@ -34,12 +38,121 @@ from recorder import AudioRecorder
 from settings_manager import SettingsManager
 from settings_window import SettingsWindow
 from theme import normalize_theme
-from toast import ProcessingSpinner, ToastNotification
+from toast import DEFAULT_ANCHOR, ProcessingSpinner, ToastNotification, normalize_anchor
 from tray import TrayIcon
 from ui_host import UIHost
+from win_paste import send_ctrl_v, set_clipboard_text
 
-pyautogui.FAILSAFE = False
-pyautogui.PAUSE = 0
+_MODIFIER_KEYS = (
+    "left ctrl", "right ctrl", "ctrl",
+    "left alt", "right alt", "alt", "alt gr",
+    "left shift", "right shift", "shift",
+    "left windows", "right windows", "windows",
+)
+_PUNCT = " \t\r\n.,!?;:\"'`()[]{}"
+
+
+def _pyautogui():
+    # Imported on first insert: pyautogui pulls in Pillow and screen probing,
+    # which is noticeable on an autostarted cold launch.
+    import pyautogui
+
+    pyautogui.FAILSAFE = False
+    pyautogui.PAUSE = 0
+    return pyautogui
+
+
+def _decode_with_pyav(path: str) -> bytes | None:
+    """Decode to 16 kHz mono 16-bit WAV in-process; None if PyAV is missing or fails."""
+    try:
+        import av  # installed with faster-whisper
+    except ImportError:
+        return None
+    try:
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=16000)
+        pcm = bytearray()
+        with av.open(path) as container:
+            for frame in container.decode(audio=0):
+                for out in resampler.resample(frame):
+                    pcm += out.to_ndarray().tobytes()
+            for out in resampler.resample(None):
+                pcm += out.to_ndarray().tobytes()
+    except Exception as exc:
+        log.debug("PyAV decode failed for %s: %s", path, exc)
+        return None
+    if not pcm:
+        return None
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(pcm)
+    return buf.getvalue()
+
+
+def _pa_frames_per_buffer(device_info: dict, rate: int) -> int:
+    """Buffer sized to the device's low-latency period: a power of two in [256, 2048]."""
+    try:
+        latency = float(device_info.get("defaultLowInputLatency", 0.0) or 0.0)
+    except (TypeError, ValueError):
+        latency = 0.0
+    frames = int(latency * rate) if latency > 0 else 2048
+    size = 256
+    while size < frames and size < 2048:
+        size *= 2
+    return size
+
+
+def _write_mono_wav(path: str, audio, rate: int):
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(int(rate))
+        wf.writeframes(audio.tobytes())
+
+
+def _clipboard_sequence() -> int | None:
+    """Windows clipboard change counter; None where unavailable."""
+    if sys.platform != "win32":
+        return None
+    try:
+        return int(ctypes.windll.user32.GetClipboardSequenceNumber())
+    except Exception:
+        return None
+
+
+# Engine bookkeeping that _MapSettings writes through to the real settings.
+_MAP_PERSISTED_KEYS = ("local_ready_models", "runtime_probe_cache")
+
+
+class _MapSettings:
+    """Settings view over a plain options dict, for engines built outside the main settings."""
+
+    def __init__(self, data, backing_settings=None):
+        self._data = data
+        self._backing_settings = backing_settings
+
+    def rebind(self, data):
+        self._data = data
+
+    def get(self, key, default=None):
+        if key in _MAP_PERSISTED_KEYS and self._backing_settings is not None:
+            return self._backing_settings.get(key, default)
+        return self._data.get(key, default)
+
+    def update(self, new_settings: dict):
+        if not isinstance(new_settings, dict):
+            return
+        payload = {k: v for k, v in new_settings.items() if k in _MAP_PERSISTED_KEYS and v is not None}
+        if not payload:
+            return
+        self._data.update(payload)
+        if self._backing_settings is not None and hasattr(self._backing_settings, "update"):
+            try:
+                self._backing_settings.update(payload)
+            except Exception:
+                pass
 
 
 class SmolSTTApp:
@@ -53,23 +166,32 @@ class SmolSTTApp:
             pass
         self._install_crash_logging()
         self._settings = SettingsManager()
+        self._toast_cache: dict | None = None
+        self._clip_base: str | None = None
+        self._theme_cache = normalize_theme(self._settings.get("app_theme", "dark"))
+        # Read per audio block by the level callbacks; refreshed on save.
+        self._show_indicator = bool(self._settings.get("show_recording_indicator", True))
+        self._typing_delay = 1.0 / self._get_typing_speed()
 
         self._ui = UIHost()
         self._recorder = AudioRecorder(self._settings)
         self._client = WhisperClient(self._settings)
+        if self._settings.get("whisper_backend", "local") == "api":
+            threading.Thread(target=self._client.warmup, name="smolstt-warmup", daemon=True).start()
         self._local_engine = LocalInferenceEngine(self._settings)
+        # Engines for test/recorded clips, keyed by (model, backend, device).
+        self._blob_engines: dict[tuple[str, str, str], tuple[LocalInferenceEngine, _MapSettings]] = {}
         self._hotkey_mgr = HotkeyManager()
         self._system_hotkey_mgr = HotkeyManager()
-        self._overlay = RecordingOverlay(self._ui, anchor_getter=self._notification_anchor)
+        self._overlay = RecordingOverlay(self._ui, anchor_getter=self._cached_anchor)
         self._overlay_refs = 0
         self._tray = TrayIcon(self)
         self._toast = ToastNotification(self._ui)
         self._spinner = ProcessingSpinner(self._ui)
         self._speed_stats_mode = "disabled"
-        self._speed_samples: deque[tuple[float, int, float]] = deque()
+        self._speed_samples: deque[tuple[int, int, int]] = deque()  # (monotonic ns, chars, elapsed ns)
         self._test_capture_stream = None
-        self._test_capture_frames: list[np.ndarray] = []
-        self._test_capture_lock = threading.Lock()
+        self._test_capture_buf = CaptureBuffer()
         self._test_capture_rate = 16000
         self._test_capture_channels = 1
         self._test_capture_mode = None
@@ -77,7 +199,16 @@ class SmolSTTApp:
         self._pa_audio = None
         self._pa_stream = None
         self._pa_thread = None
+        self._pa_consumer = None
         self._pa_stop_event = threading.Event()
+        self._last_clip: str | None = None
+        self._last_clip_seq: int | None = None
+        # One reused worker runs every transcription, in submission order.
+        self._tx_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smolstt-tx")
+        self._mod_release_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smolstt-keys")
+        # Clip writes; one worker keeps them in order.
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smolstt-io")
+        self._clip_write = None
         self._set_speed_stats_mode(self._settings.get("speed_stats_mode", "disabled"))
         self._settings_win = SettingsWindow(
             self._ui,
@@ -100,9 +231,12 @@ class SmolSTTApp:
 
         self._recording = False
         self._system_audio_recording = False
+        self._last_toggle = 0.0
 
     def start(self):
         self._tray.start()
+        # JIT-compiles the capture RMS kernel if numba is installed.
+        threading.Thread(target=warmup_audio_kernels, name="smolstt-kernels", daemon=True).start()
         self._register_hotkey()
         log.info(
             "SmolSTT ready - hotkey: %s mode: %s",
@@ -118,6 +252,17 @@ class SmolSTTApp:
         else:
             self._start()
 
+    def _submit_job(self, fn):
+        future = self._tx_pool.submit(fn)
+        future.add_done_callback(self._on_job_done)
+
+    def _on_job_done(self, future):
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            log.error("Background job failed", exc_info=(type(exc), exc, exc.__traceback__))
+
     def _register_hotkey(self):
         hotkey = self._settings.get("hotkey", "ctrl+shift+space")
         system_hotkey = str(self._settings.get("system_audio_hotkey", "") or "").strip()
@@ -160,14 +305,21 @@ class SmolSTTApp:
                 )
 
     def _toggle_from_hotkey(self):
-        log.debug("Hotkey triggered (recording=%s)", self._recording)
+        now = time.monotonic()
+        if now - self._last_toggle < 0.05:
+            # Key repeat / double-delivered hotkey events; ignore the echo.
+            return
+        self._last_toggle = now
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Hotkey triggered (recording=%s)", self._recording)
         try:
             self.toggle()
         finally:
             self._release_modifier_keys()
 
     def _toggle_system_audio_hotkey(self):
-        log.debug("System audio hotkey triggered (recording=%s)", self._system_audio_recording)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("System audio hotkey triggered (recording=%s)", self._system_audio_recording)
         try:
             if self._system_audio_recording:
                 self._stop_system_audio_capture()
@@ -177,14 +329,13 @@ class SmolSTTApp:
             self._release_modifier_keys()
 
     def _release_modifier_keys(self):
+        # Each release is a synthetic key event; do them off the hotkey
+        # listener thread so the next hotkey isn't delayed behind them.
+        self._mod_release_pool.submit(self._release_modifier_keys_now)
+
+    def _release_modifier_keys_now(self):
         # Safety net for rare stuck-modifier states after global hotkeys.
-        keys = (
-            "left ctrl", "right ctrl", "ctrl",
-            "left alt", "right alt", "alt", "alt gr",
-            "left shift", "right shift", "shift",
-            "left windows", "right windows", "windows",
-        )
-        for key in keys:
+        for key in _MODIFIER_KEYS:
             try:
                 kb.release(key)
             except Exception:
@@ -206,14 +357,7 @@ class SmolSTTApp:
             self._toast.show(
                 "SmolSTT - Error",
                 f"Microphone error: {exc}",
-                theme=self.current_theme(),
-                font_size=self._toast_font_size(),
-                width=self._toast_width(),
-                max_height=self._toast_height(),
-                fade_in_duration_ms=self._toast_fade_in_duration_ms(),
-                visible_duration_ms=self._toast_duration_ms(),
-                fade_duration_ms=self._toast_fade_duration_ms(),
-                anchor=self._notification_anchor(),
+                **self._toast_snapshot(),
             )
 
     def _start_system_audio_capture(self):
@@ -244,11 +388,12 @@ class SmolSTTApp:
             log.error("System audio capture stop failed: %s", msg)
             self._tray.set_status("Error - see console")
             return
-        threading.Thread(target=self._process_system_audio_clip, daemon=True).start()
+        self._submit_job(self._process_system_audio_clip)
 
     def _process_system_audio_clip(self):
         opts = {"portable_models": False}
         path = self._test_clip_path(opts)
+        self._wait_clip_write()
         if not os.path.exists(path):
             self._tray.set_status("No audio captured")
             return
@@ -269,7 +414,7 @@ class SmolSTTApp:
         self._overlay_release()
         self._tray.set_recording(False)
         self._tray.set_processing()
-        threading.Thread(target=self._process, daemon=True).start()
+        self._submit_job(self._process)
 
     def _overlay_acquire(self):
         if not self._settings.get("show_recording_indicator", True):
@@ -287,60 +432,57 @@ class SmolSTTApp:
             self._overlay.hide()
 
     def _on_live_rms(self, rms: float):
-        if not self._settings.get("show_recording_indicator", True):
+        if not self._show_indicator or not self._overlay.needs_rms():
             return
         self._overlay.set_rms(rms)
 
     def _process(self):
+        sget = self._settings.get
+        show_spinner = bool(sget("show_transcribing_notification", True))
+        shown = False
         try:
+            # Put the spinner up before stopping the stream so feedback isn't
+            # delayed by the final flush/encode.
+            model = sget("model", "")
+            backend = sget("whisper_backend", "local")
+            use_local = is_parakeet_model(model) or (is_whisper_model(model) and backend == "local")
+            if show_spinner:
+                snap = self._toast_snapshot()
+                spinner_label = "Transcribing"
+                if use_local and not self._local_engine.is_ready_cached(model):
+                    spinner_label = "Downloading"
+                self._spinner.show(
+                    theme=snap["theme"],
+                    label=spinner_label,
+                    font_size=snap["font_size"],
+                    anchor=snap["anchor"],
+                )
+                shown = True
             wav = self._recorder.stop()
             if not wav:
                 info = self._recorder.get_last_capture_info()
-                rejected_by_threshold = bool(info.get("rejected_by_threshold"))
                 rms = info.get("rms")
                 threshold = info.get("threshold")
-                sensitivity_enabled = bool(info.get("sensitivity_enabled"))
-                if rejected_by_threshold or (
-                    sensitivity_enabled
+                if info.get("rejected_by_threshold") or (
+                    info.get("sensitivity_enabled")
                     and rms is not None
                     and threshold is not None
-                    and float(rms) < float(threshold)
+                    and rms < threshold
                 ):
-                    ratio = f"{float(rms):.2f}/{float(threshold):.0f}"
+                    ratio = f"{rms:.2f}/{threshold:.0f}"
                     msg = f"Sensitivity Threshold: <b>{ratio}</b>"
                     log.info("Sensitivity rejection toast: %s", msg)
-                    if self._settings.get("show_sensitivity_reject_notification", True):
+                    if sget("show_sensitivity_reject_notification", True):
                         self._toast.show(
                             "Sensitivity Threshold",
                             msg,
-                            theme=self.current_theme(),
-                            font_size=self._toast_font_size(),
-                            width=self._toast_width(),
-                            max_height=self._toast_height(),
-                            fade_in_duration_ms=self._toast_fade_in_duration_ms(),
-                            visible_duration_ms=self._toast_duration_ms(),
-                            fade_duration_ms=self._toast_fade_duration_ms(),
-                            anchor=self._notification_anchor(),
+                            **self._toast_snapshot(),
                         )
                     self._tray.set_status("Rejected by sensitivity threshold")
                     return
                 self._tray.set_status("No audio captured")
                 return
 
-            show_spinner = bool(self._settings.get("show_transcribing_notification", True))
-            model = self._settings.get("model", "")
-            backend = self._settings.get("whisper_backend", "local")
-            use_local = is_parakeet_model(model) or (is_whisper_model(model) and backend == "local")
-            if show_spinner:
-                spinner_label = "Transcribing"
-                if use_local and not self._local_engine.is_ready_cached(model):
-                    spinner_label = "Downloading"
-                self._spinner.show(
-                    theme=self.current_theme(),
-                    label=spinner_label,
-                    font_size=self._toast_font_size(),
-                    anchor=self._notification_anchor(),
-                )
             request_started = time.perf_counter()
             try:
                 if use_local:
@@ -353,14 +495,7 @@ class SmolSTTApp:
                 self._toast.show(
                     "SmolSTT - Error",
                     str(exc)[:200],
-                    theme=self.current_theme(),
-                    font_size=self._toast_font_size(),
-                    width=self._toast_width(),
-                    max_height=self._toast_height(),
-                    fade_in_duration_ms=self._toast_fade_in_duration_ms(),
-                    visible_duration_ms=self._toast_duration_ms(),
-                    fade_duration_ms=self._toast_fade_duration_ms(),
-                    anchor=self._notification_anchor(),
+                    **self._toast_snapshot(),
                 )
                 return
 
@@ -368,18 +503,11 @@ class SmolSTTApp:
             if not cleaned:
                 self._tray.set_status("(empty result)")
                 self._record_speed_stats(0, time.perf_counter() - request_started)
-                if self._settings.get("show_empty_notification", True):
+                if sget("show_empty_notification", True):
                     self._toast.show(
                         "",
                         "Empty Input",
-                        theme=self.current_theme(),
-                        font_size=self._toast_font_size(),
-                        width=self._toast_width(),
-                        max_height=self._toast_height(),
-                        fade_in_duration_ms=self._toast_fade_in_duration_ms(),
-                        visible_duration_ms=self._toast_duration_ms(),
-                        fade_duration_ms=self._toast_fade_duration_ms(),
-                        anchor=self._notification_anchor(),
+                        **self._toast_snapshot(),
                     )
                 return
 
@@ -387,16 +515,15 @@ class SmolSTTApp:
             self._deliver(cleaned, speed_badge=self._speed_badge_text())
             self._tray.set_status("Ready")
         finally:
-            if self._settings.get("show_transcribing_notification", True):
+            if shown:
                 self._spinner.hide()
 
     def _sanitize_text(self, text: str) -> str:
         cleaned = (text or "").strip()
-        if not cleaned:
-            return ""
-
-        token = cleaned.lower().strip(" \t\r\n.,!?;:\"'`()[]{}")
-        if token == "you":
+        # Drop the lone "you" Whisper hallucinates on silence; only lowercase
+        # a token that is already the right length.
+        token = cleaned.strip(_PUNCT)
+        if len(token) == 3 and token.lower() == "you":
             return ""
         return cleaned
 
@@ -405,72 +532,104 @@ class SmolSTTApp:
         do_insert = self._settings.get("output_insert", False) and not bool(force_no_insert)
         method = self._settings.get("output_insert_method", "paste")
         notify = self._settings.get("show_notification", True)
-        typing_speed = self._get_typing_speed()
         try:
             self._settings_win.set_test_caption_text(text)
         except Exception:
             pass
 
+        clip_seq = None
+        clip_changed = False
         if do_clipboard or (do_insert and method == "paste"):
-            pyperclip.copy(text)
+            clip_seq = _clipboard_sequence()
+            clip_changed = self._copy_to_clipboard(text, clip_seq)
 
         if do_insert:
-            time.sleep(0.15)
             if method == "paste":
-                pyautogui.hotkey("ctrl", "v")
+                if clip_changed:
+                    self._wait_for_clipboard(text, clip_seq)
+                if not send_ctrl_v():
+                    _pyautogui().hotkey("ctrl", "v")
             else:
-                kb.write(text, delay=1.0 / typing_speed)
+                time.sleep(0.15)
+                kb.write(text, delay=self._typing_delay)
 
         if notify:
             self._toast.show(
                 "",
                 text,
-                theme=self.current_theme(),
-                font_size=self._toast_font_size(),
-                width=self._toast_width(),
-                max_height=self._toast_height(),
-                fade_in_duration_ms=self._toast_fade_in_duration_ms(),
-                visible_duration_ms=self._toast_duration_ms(),
-                fade_duration_ms=self._toast_fade_duration_ms(),
                 speed_badge=speed_badge,
-                anchor=self._notification_anchor(),
+                **self._toast_snapshot(),
             )
 
+    def _copy_to_clipboard(self, text: str, seq: int | None) -> bool:
+        # Only skip when the clipboard provably still holds our last copy;
+        # otherwise a paste could insert something the user copied since.
+        if seq is not None and text == self._last_clip and seq == self._last_clip_seq:
+            return False
+        if not set_clipboard_text(text):
+            import pyperclip
+
+            pyperclip.copy(text)
+        self._last_clip = text
+        self._last_clip_seq = _clipboard_sequence()
+        return True
+
+    def _wait_for_clipboard(self, text: str, before_seq: int | None, timeout_s: float = 0.15) -> None:
+        # Paste as soon as the clipboard reflects the copy instead of always
+        # sleeping for the worst case.
+        import pyperclip
+
+        deadline = time.monotonic() + timeout_s
+        while True:
+            if before_seq is not None:
+                seq = _clipboard_sequence()
+                if seq is not None and seq != before_seq:
+                    return
+            else:
+                try:
+                    if pyperclip.paste() == text:
+                        return
+                except Exception:
+                    pass
+            if time.monotonic() >= deadline:
+                return
+            time.sleep(0.005)
+
+    def _toast_snapshot(self) -> dict:
+        # Toast/spinner keyword args, parsed once and reused until the
+        # next settings save invalidates them.
+        snap = self._toast_cache
+        if snap is None:
+            snap = {
+                "theme": self.current_theme(),
+                "font_size": self._toast_font_size(),
+                "width": self._toast_width(),
+                "max_height": self._toast_height(),
+                "fade_in_duration_ms": self._toast_fade_in_duration_ms(),
+                "visible_duration_ms": self._toast_duration_ms(),
+                "fade_duration_ms": self._toast_fade_duration_ms(),
+                "anchor": self._notification_anchor(),
+            }
+            self._toast_cache = snap
+        return snap
+
+    def _cached_anchor(self) -> str:
+        return self._toast_snapshot()["anchor"]
+
     def _get_typing_speed(self) -> int:
-        try:
-            speed = int(self._settings.get("typing_speed", 100))
-        except (TypeError, ValueError):
-            speed = 100
-        return max(50, min(speed, 5000))
+        return self._settings.get_int_clamped("typing_speed", 100, 50, 5000)
 
     def _toast_font_size(self) -> int:
-        try:
-            size = int(self._settings.get("notification_font_size", 11))
-        except (TypeError, ValueError):
-            size = 11
-        return max(9, min(size, 24))
+        return self._settings.get_int_clamped("notification_font_size", 11, 9, 24)
 
     def _toast_height(self) -> int:
-        try:
-            height = int(self._settings.get("notification_height", 0))
-        except (TypeError, ValueError):
-            height = 0
-        return max(0, min(height, 2400))
+        return self._settings.get_int_clamped("notification_height", 0, 0, 2400)
 
     def _toast_width(self) -> int:
-        try:
-            width = int(self._settings.get("notification_width", 390))
-        except (TypeError, ValueError):
-            width = 390
-        return max(50, min(width, 2400))
+        return self._settings.get_int_clamped("notification_width", 390, 50, 2400)
 
     def _notification_anchor(self) -> str:
-        anchor = str(self._settings.get("notification_anchor", "bottom_right") or "bottom_right").strip().lower()
-        allowed = {
-            "bottom_right", "bottom_left", "top_right", "top_left",
-            "top_center", "bottom_center", "left_center", "right_center",
-        }
-        return anchor if anchor in allowed else "bottom_right"
+        return normalize_anchor(self._settings.get("notification_anchor", DEFAULT_ANCHOR))
 
     def _preview_notification_from_settings(
         self,
@@ -503,43 +662,23 @@ class SmolSTTApp:
         self._overlay.preview_pulse(duration_ms=max(300, int(duration_ms)), anchor=anchor)
 
     def _toast_duration_ms(self) -> int:
-        try:
-            seconds = float(self._settings.get("notification_duration_s", 4.0))
-            ms = int(seconds * 1000.0)
-        except (TypeError, ValueError):
-            try:
-                ms = int(self._settings.get("notification_duration_ms", 4000))
-            except (TypeError, ValueError):
-                ms = 4000
-        return max(300, min(ms, 60000))
+        return int(self._settings.get_float_clamped("notification_duration_s", 4.0, 0.3, 60.0) * 1000.0)
 
     def _toast_fade_in_duration_ms(self) -> int:
-        try:
-            seconds = float(self._settings.get("notification_fade_in_duration_s", 0.10))
-            ms = int(seconds * 1000.0)
-        except (TypeError, ValueError):
-            ms = 100
-        return max(0, min(ms, 10000))
+        return int(self._settings.get_float_clamped("notification_fade_in_duration_s", 0.10, 0.0, 10.0) * 1000.0)
 
     def _toast_fade_duration_ms(self) -> int:
-        try:
-            seconds = float(self._settings.get("notification_fade_duration_s", 0.22))
-            ms = int(seconds * 1000.0)
-        except (TypeError, ValueError):
-            try:
-                ms = int(self._settings.get("notification_fade_duration_ms", 220))
-            except (TypeError, ValueError):
-                ms = 220
-        return max(0, min(ms, 10000))
+        return int(self._settings.get_float_clamped("notification_fade_duration_s", 0.22, 0.0, 10.0) * 1000.0)
 
     def open_settings(self):
         self._settings_win.open()
 
     def current_theme(self) -> str:
-        return normalize_theme(self._settings.get("app_theme", "dark"))
+        return self._theme_cache
 
     def _apply_theme(self):
-        self._ui.set_theme(self.current_theme())
+        self._theme_cache = normalize_theme(self._settings.get("app_theme", "dark"))
+        self._ui.set_theme(self._theme_cache)
         self._tray.refresh_theme()
 
     def _effective_options(self, overrides: dict | None = None) -> dict:
@@ -547,6 +686,9 @@ class SmolSTTApp:
             "model": self._settings.get("model", ""),
             "whisper_backend": self._settings.get("whisper_backend", "local"),
             "model_device": self._settings.get("model_device", "gpu"),
+            "whisper_compute_type": self._settings.get("whisper_compute_type", "auto"),
+            "whisper_vad_filter": bool(self._settings.get("whisper_vad_filter", True)),
+            "whisper_beam_size": self._settings.get_int_clamped("whisper_beam_size", 1, 1, 10),
             "portable_models": bool(self._settings.get("portable_models", False)),
             "api_url": self._settings.get("api_url", "http://localhost:9876"),
             "api_endpoint": self._settings.get("api_endpoint", "/v1/audio/transcriptions"),
@@ -567,27 +709,48 @@ class SmolSTTApp:
             else:
                 base = os.path.dirname(os.path.abspath(__file__))
             return os.path.join(base, "test.wav")
-        base = os.path.join(tempfile.gettempdir(), "SmolSTT")
-        os.makedirs(base, exist_ok=True)
-        return os.path.join(base, "test.wav")
+        return os.path.join(self._clip_temp_dir(), "test.wav")
+
+    def _clip_temp_dir(self) -> str:
+        # Created once per run; the settings window polls the clip paths.
+        if self._clip_base is None:
+            base = os.path.join(tempfile.gettempdir(), "SmolSTT")
+            os.makedirs(base, exist_ok=True)
+            self._clip_base = base
+        return self._clip_base
+
+    def _start_capture_spill(self, rate: int, channels: int):
+        try:
+            self._test_capture_buf.spill_to(self._test_capture_spill_path(), rate, channels)
+        except Exception as exc:
+            log.warning("Test capture: cannot spill to disk, buffering in memory: %s", exc)
+
+    def _test_capture_spill_path(self) -> str:
+        # Capture streams here while recording; reused (overwritten) every time.
+        return os.path.join(self._clip_temp_dir(), "capture.part.wav")
 
     def _resolve_test_audio_path(self, overrides: dict | None = None) -> str | None:
+        self._wait_clip_write()
         opts = self._effective_options(overrides)
         input_file = str(opts.get("input_file_path", "") or "").strip()
         if input_file and os.path.isfile(input_file):
             return input_file
         wav_path = self._test_clip_path(opts)
-        if os.path.exists(wav_path):
+        if os.path.isfile(wav_path):
             return wav_path
-        mp3_path = os.path.splitext(wav_path)[0] + ".mp3"
-        if os.path.exists(mp3_path):
+        mp3_path = wav_path[:-4] + ".mp3"
+        if os.path.isfile(mp3_path):
             return mp3_path
         return None
 
     def _has_recorded_clip(self, overrides: dict | None = None) -> bool:
+        pending = self._clip_write
+        if pending is not None and not pending.done():
+            return True  # polled by the settings UI; don't block on the write
         return self._resolve_test_audio_path(overrides) is not None
 
     def _delete_recorded_clip(self, overrides: dict | None = None) -> tuple[bool, str]:
+        self._wait_clip_write()
         path = self._test_clip_path(overrides)
         if not os.path.exists(path):
             return False, "No recorded clip found."
@@ -633,12 +796,11 @@ class SmolSTTApp:
         def _callback(indata, frames, time_info, status):
             if status:
                 return
-            with self._test_capture_lock:
-                self._test_capture_frames.append(indata.copy())
-            if self._settings.get("show_recording_indicator", True):
+            # Single producer; stop() reads only after the stream has stopped.
+            self._test_capture_buf.append(indata)
+            if self._show_indicator and self._overlay.needs_rms():
                 try:
-                    rms = float(np.sqrt(np.mean(np.square(indata.astype(np.float32)))))
-                    self._overlay.set_rms(rms)
+                    self._overlay.set_rms(rms_int16(indata))
                 except Exception:
                     pass
 
@@ -655,10 +817,7 @@ class SmolSTTApp:
                 default_rate = float(info.get("default_samplerate", preferred_rate) or preferred_rate)
             except Exception:
                 default_rate = float(preferred_rate)
-            rate_opts = []
-            for r in (preferred_rate, int(default_rate), 48000, 44100):
-                if r and r not in rate_opts:
-                    rate_opts.append(float(r))
+            rate_opts = dict.fromkeys(float(r) for r in (preferred_rate, int(default_rate), 48000, 44100) if r)
             for r in rate_opts:
                 candidates.append((device_index, 1, r, None, f"microphone @ {int(r)}Hz"))
         else:
@@ -687,7 +846,8 @@ class SmolSTTApp:
                     dev, ch, int(rate), label,
                 )
                 sd.check_input_settings(device=dev, channels=ch, samplerate=rate, dtype="int16", extra_settings=extra)
-                self._test_capture_frames = []
+                self._test_capture_buf.reset(int(rate) * ch * 2)
+                self._start_capture_spill(int(rate), ch)
                 self._test_capture_rate = int(rate)
                 self._test_capture_channels = ch
                 self._test_capture_mode = source
@@ -706,7 +866,7 @@ class SmolSTTApp:
                 return True, "OK"
             except Exception as exc:
                 self._test_capture_stream = None
-                self._test_capture_frames = []
+                self._test_capture_buf.reset()
                 self._test_capture_mode = None
                 self._test_capture_backend = None
                 last_error = f"{label}: {exc}"
@@ -767,6 +927,7 @@ class SmolSTTApp:
         stream = None
         last_error = ""
         for rate in rate_candidates:
+            frames = _pa_frames_per_buffer(device_info, rate)
             for ch in channel_candidates:
                 try:
                     stream = pa.open(
@@ -775,9 +936,10 @@ class SmolSTTApp:
                         rate=rate,
                         input=True,
                         input_device_index=int(device_info["index"]),
-                        frames_per_buffer=2048,
+                        frames_per_buffer=frames,
                     )
-                    self._test_capture_frames = []
+                    self._test_capture_buf.reset(int(rate) * ch * 2)
+                    self._start_capture_spill(int(rate), ch)
                     self._test_capture_rate = int(rate)
                     self._test_capture_channels = int(ch)
                     self._test_capture_mode = "output"
@@ -786,35 +948,46 @@ class SmolSTTApp:
                     self._pa_stream = stream
                     self._pa_stop_event.clear()
 
+                    blocks: queue.SimpleQueue = queue.SimpleQueue()
+
                     def _reader():
+                        # Only reads; buffering and level work happen on the
+                        # consumer so the next read() is issued right away.
                         while not self._pa_stop_event.is_set():
                             try:
-                                data = self._pa_stream.read(2048, exception_on_overflow=False)
+                                # At least one period; more if it is already
+                                # buffered, so a backlog drains in one call.
+                                count = max(frames, self._pa_stream.get_read_available())
+                                data = self._pa_stream.read(count, exception_on_overflow=False)
                             except Exception:
                                 break
-                            arr = np.frombuffer(data, dtype=np.int16)
-                            if arr.size == 0:
-                                continue
-                            if ch > 1:
-                                arr = arr.reshape(-1, ch)
-                            else:
-                                arr = arr.reshape(-1, 1)
-                            with self._test_capture_lock:
-                                self._test_capture_frames.append(arr.copy())
-                            if self._settings.get("show_recording_indicator", True):
+                            if data:
+                                blocks.put(data)
+                        blocks.put(None)
+
+                    def _consumer():
+                        while True:
+                            data = blocks.get()
+                            if data is None:
+                                return
+                            # Copied straight from the read() bytes into a slab.
+                            self._test_capture_buf.append(data)
+                            if self._show_indicator and self._overlay.needs_rms():
                                 try:
-                                    rms = float(np.sqrt(np.mean(np.square(arr.astype(np.float32)))))
-                                    self._overlay.set_rms(rms)
+                                    self._overlay.set_rms(rms_int16(np.frombuffer(data, dtype=np.int16)))
                                 except Exception:
                                     pass
 
+                    self._pa_consumer = threading.Thread(target=_consumer, daemon=True)
+                    self._pa_consumer.start()
                     self._pa_thread = threading.Thread(target=_reader, daemon=True)
                     self._pa_thread.start()
                     log.info(
-                        "Test capture: started successfully (WASAPI loopback idx=%s ch=%d rate=%d)",
+                        "Test capture: started successfully (WASAPI loopback idx=%s ch=%d rate=%d frames=%d)",
                         int(device_info["index"]),
                         ch,
                         rate,
+                        frames,
                     )
                     return True, "OK"
                 except Exception as exc:
@@ -867,6 +1040,15 @@ class SmolSTTApp:
                     self._pa_stream.close()
             except Exception:
                 pass
+            try:
+                # Closing the stream unblocks a reader stuck in read().
+                if self._pa_thread is not None and self._pa_thread.is_alive():
+                    self._pa_thread.join(timeout=1.0)
+                # The reader's exit sentinel lets the consumer drain and finish.
+                if self._pa_consumer is not None:
+                    self._pa_consumer.join(timeout=1.0)
+            except Exception:
+                pass
             try:
                 if self._pa_audio is not None:
                     self._pa_audio.terminate()
@@ -875,6 +1057,7 @@ class SmolSTTApp:
             self._pa_stream = None
             self._pa_audio = None
             self._pa_thread = None
+            self._pa_consumer = None
         else:
             stream = self._test_capture_stream
             self._test_capture_stream = None
@@ -883,101 +1066,135 @@ class SmolSTTApp:
                 stream.close()
             except Exception:
                 pass
-        with self._test_capture_lock:
-            frames = list(self._test_capture_frames)
-            self._test_capture_frames = []
+        # The producer has been stopped/joined above, so the buffer can be
+        # drained without a lock.
+        spill_path = self._test_capture_buf.finish()
+        captured = self._test_capture_buf.nbytes > 0
+        audio = self._test_capture_buf.to_array(self._test_capture_channels)
+        self._test_capture_buf.reset()
         mode = self._test_capture_mode
         self._test_capture_mode = None
         self._test_capture_backend = None
-        if not frames:
+        if not captured:
             log.warning("Test capture: stopped with no frames captured")
             return False, "No audio captured."
-        try:
-            audio = np.concatenate(frames, axis=0)
-        except Exception:
-            return False, "No audio captured."
         if int(audio.size) <= 0:
             log.warning("Test capture: captured audio buffer is empty")
             return False, "No audio captured."
+        # The spill file already is the final clip unless the audio gets
+        # folded to mono or gain-adjusted below.
+        reuse_spill = spill_path is not None and audio.shape[1] == 1
         if audio.ndim > 1 and audio.shape[1] > 1:
             # Fold channels without cancellation: keep per-sample strongest magnitude.
-            audio_f = audio.astype(np.float32)
-            strongest_idx = np.argmax(np.abs(audio_f), axis=1)
-            mono = audio_f[np.arange(audio_f.shape[0]), strongest_idx]
-            channel_levels = np.sqrt(np.mean(np.square(audio_f), axis=0))
-            log.debug(
-                "Test capture: multi-channel input detected; channel RMS=%s using max-abs fold",
-                channel_levels.tolist(),
-            )
-            audio = mono.astype(np.int16).reshape(-1, 1)
-        mono = audio.reshape(-1).astype(np.float32)
-        rms = float(np.sqrt(np.mean(np.square(mono)))) if mono.size > 0 else 0.0
-        dbfs_before = (20.0 * np.log10(max(rms, 1.0) / 32768.0)) if mono.size > 0 else -90.0
-        active_ratio = float(np.mean(np.abs(mono) > 600.0)) if mono.size > 0 else 0.0
+            if log.isEnabledFor(logging.DEBUG):
+                channel_levels = [rms_int16(np.ascontiguousarray(audio[:, c])) for c in range(audio.shape[1])]
+                log.debug(
+                    "Test capture: multi-channel input detected; channel RMS=%s using max-abs fold",
+                    channel_levels,
+                )
+            folded, _ = fold_max_abs(audio)
+            audio = folded.reshape(-1, 1)
+        # Analysis stays on the int16 samples; level, activity and peak come
+        # from one scan instead of separate abs/compare/max passes.
+        mono = audio.reshape(-1)
+        sample_total = int(mono.size)
+        ssq, active_count, peak = level_stats_int16(mono, 600)
+        rms = (ssq / sample_total) ** 0.5 if sample_total else 0.0
+        dbfs_raw = (20.0 * math.log10(max(rms, 1.0) / 32768.0)) if sample_total > 0 else -90.0
+        active_ratio = (float(active_count) / sample_total) if sample_total > 0 else 0.0
 
         # Output loopback can be captured very quietly on some drivers.
         # Normalize low-level output recordings to improve downstream STT.
-        if mode == "output" and mono.size > 0 and dbfs_before < -32.0:
+        if mode == "output" and sample_total > 0 and dbfs_raw < -32.0:
             target_dbfs = -24.0
             target_rms = 32768.0 * (10.0 ** (target_dbfs / 20.0))
-            peak = float(np.max(np.abs(mono))) if mono.size > 0 else 1.0
             rms_gain = target_rms / max(rms, 1.0)
             peak_gain = 30000.0 / max(peak, 1.0)  # keep headroom, avoid hard clipping
             gain = max(1.0, min(rms_gain, peak_gain, 12.0))
             if gain > 1.05:
-                boosted = np.clip(mono * gain, -32768.0, 32767.0)
+                reuse_spill = False
+                # One float32 scratch array, rounded and clipped in place.
+                boosted = np.multiply(mono, np.float32(gain), dtype=np.float32)
+                np.rint(boosted, out=boosted)
+                np.clip(boosted, -32768.0, 32767.0, out=boosted)
                 audio = boosted.astype(np.int16).reshape(-1, 1)
-                mono = boosted
-                rms = float(np.sqrt(np.mean(np.square(mono))))
+                del boosted
+                # peak * gain <= 30000, so nothing clipped and both RMS and
+                # dBFS follow from the gain without another pass.
+                dbfs_before = dbfs_raw
+                rms *= gain
+                dbfs_raw += 20.0 * math.log10(gain)
                 log.info(
                     "Test capture: output gain applied x%.2f (dbfs %.1f -> %.1f)",
                     gain,
                     dbfs_before,
-                    20.0 * np.log10(max(rms, 1.0) / 32768.0),
+                    dbfs_raw,
                 )
 
-        dbfs_raw = (20.0 * np.log10(max(rms, 1.0) / 32768.0)) if mono.size > 0 else -90.0
         dbfs = 0.0 if rms <= 1.0 else dbfs_raw
 
         opts = self._effective_options(overrides)
         path = self._test_clip_path(opts)
+        rate = int(self._test_capture_rate)
+        sample_count = int(audio.shape[0])
+        duration_s = (float(sample_count) / float(rate)) if rate > 0 else 0.0
+        suppress_recorded_toast = bool(opts.get("suppress_recorded_toast", False))
+        self._wait_clip_write()  # the previous clip may still be going to the same path
         try:
             os.makedirs(os.path.dirname(path), exist_ok=True)
-            with wave.open(path, "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(int(self._test_capture_rate))
-                wf.writeframes(audio.tobytes())
-            sample_count = int(audio.shape[0])
-            duration_s = (float(sample_count) / float(self._test_capture_rate)) if self._test_capture_rate > 0 else 0.0
+            if reuse_spill:
+                try:
+                    os.replace(spill_path, path)
+                except OSError:
+                    reuse_spill = False
+        except Exception as exc:
+            log.exception("Test capture: save failed")
+            return False, f"Could not save recording: {exc}"
+
+        def _saved():
             log.info(
                 "Test capture: saved clip path=%s samples=%d rate=%d duration=%.2fs avg_dbfs=%.1f active=%.1f%% mode=%s",
                 path,
                 sample_count,
-                int(self._test_capture_rate),
+                rate,
                 duration_s,
                 dbfs,
                 active_ratio * 100.0,
                 mode,
             )
-            suppress_recorded_toast = bool(opts.get("suppress_recorded_toast", False))
             if mode in {"output", "mic"} and not suppress_recorded_toast:
                 self._toast.show(
                     "",
                     f"Audio recorded {duration_s:.2f} s | {dbfs:.1f} dBFS avg",
-                    theme=self.current_theme(),
-                    font_size=self._toast_font_size(),
-                    width=self._toast_width(),
-                    max_height=self._toast_height(),
-                    fade_in_duration_ms=self._toast_fade_in_duration_ms(),
-                    visible_duration_ms=self._toast_duration_ms(),
-                    fade_duration_ms=self._toast_fade_duration_ms(),
-                    anchor=self._notification_anchor(),
+                    **self._toast_snapshot(),
                 )
-            return True, f"Audio recorded {duration_s:.2f}s."
-        except Exception as exc:
-            log.exception("Test capture: save failed")
-            return False, f"Could not save recording: {exc}"
+
+        def _write_done(fut):
+            exc = fut.exception()
+            if exc is None:
+                _saved()
+                return
+            log.error("Test capture: save failed: %s", exc)
+            self._toast.show("SmolSTT - Error", f"Could not save recording: {exc}", **self._toast_snapshot())
+
+        if reuse_spill:
+            _saved()
+        else:
+            # A long clip is several MB of disk I/O; write it on the I/O
+            # worker so the caller (often the settings UI) returns at once.
+            # Readers of the clip wait on this via _wait_clip_write().
+            self._clip_write = self._io_pool.submit(_write_mono_wav, path, audio, rate)
+            self._clip_write.add_done_callback(_write_done)
+        return True, f"Audio recorded {duration_s:.2f}s."
+
+    def _wait_clip_write(self):
+        pending = self._clip_write
+        if pending is None:
+            return
+        try:
+            pending.result()
+        except Exception:
+            pass  # already reported by the write callback
 
     def _use_recorded_clip(self, overrides: dict | None = None) -> tuple[bool, str]:
         opts = self._effective_options(overrides)
@@ -999,28 +1216,6 @@ class SmolSTTApp:
         force_no_insert: bool,
         context: str = "Transcription",
     ) -> tuple[bool, str]:
-
-        class _MapSettings:
-            def __init__(self, data, backing_settings=None):
-                self._data = data
-                self._backing_settings = backing_settings
-
-            def get(self, key, default=None):
-                return self._data.get(key, default)
-
-            def update(self, new_settings: dict):
-                if not isinstance(new_settings, dict):
-                    return
-                token_payload = new_settings.get("local_ready_models")
-                if token_payload is None:
-                    return
-                self._data["local_ready_models"] = token_payload
-                if self._backing_settings is not None and hasattr(self._backing_settings, "update"):
-                    try:
-                        self._backing_settings.update({"local_ready_models": token_payload})
-                    except Exception:
-                        pass
-
         started = time.perf_counter()
         model = str(opts.get("model", ""))
         backend = str(opts.get("whisper_backend", "local"))
@@ -1031,14 +1226,15 @@ class SmolSTTApp:
         )
         settings_obj = _MapSettings(opts, backing_settings=self._settings)
         show_spinner = bool(self._settings.get("show_transcribing_notification", True))
-        local_engine = LocalInferenceEngine(settings_obj) if use_local else None
+        local_engine = self._blob_engine(opts, model, backend) if use_local else None
         if show_spinner:
             # Do not claim "Downloading" in this path; we can't guarantee an actual fetch.
+            snap = self._toast_snapshot()
             self._spinner.show(
-                theme=self.current_theme(),
+                theme=snap["theme"],
                 label="Transcribing",
-                font_size=self._toast_font_size(),
-                anchor=self._notification_anchor(),
+                font_size=snap["font_size"],
+                anchor=snap["anchor"],
             )
         try:
             if use_local:
@@ -1058,14 +1254,7 @@ class SmolSTTApp:
                 self._toast.show(
                     "",
                     "Empty Input",
-                    theme=self.current_theme(),
-                    font_size=self._toast_font_size(),
-                    width=self._toast_width(),
-                    max_height=self._toast_height(),
-                    fade_in_duration_ms=self._toast_fade_in_duration_ms(),
-                    visible_duration_ms=self._toast_duration_ms(),
-                    fade_duration_ms=self._toast_fade_duration_ms(),
-                    anchor=self._notification_anchor(),
+                    **self._toast_snapshot(),
                 )
                 log.info("%s: empty result toast shown", context)
             else:
@@ -1078,9 +1267,25 @@ class SmolSTTApp:
             if show_spinner:
                 self._spinner.hide()
 
+    def _blob_engine(self, opts: dict, model: str, backend: str) -> LocalInferenceEngine:
+        # Reuse one engine per model/backend/device so its warm and probe
+        # state survives between clips; it reads the latest opts each call.
+        key = (model, backend, str(opts.get("model_device", "gpu")))
+        cached = self._blob_engines.get(key)
+        if cached is None:
+            settings_obj = _MapSettings(opts, backing_settings=self._settings)
+            cached = (LocalInferenceEngine(settings_obj), settings_obj)
+            self._blob_engines[key] = cached
+        else:
+            cached[1].rebind(opts)
+        return cached[0]
+
     def _load_audio_for_transcribe(self, path: str) -> bytes:
         ext = os.path.splitext(path or "")[1].lower()
         if ext in {".wav", ".mp3"}:
+            decoded = _decode_with_pyav(path)
+            if decoded:
+                return decoded
             cmd = [
                 "ffmpeg",
                 "-hide_banner",
@@ -1102,9 +1307,16 @@ class SmolSTTApp:
                     return result.stdout
             except Exception:
                 pass
+        # Peek at the header first: a mono (or non-WAV) file is returned as
+        # read, without parsing the whole buffer again in memory.
+        try:
+            with wave.open(path, "rb") as rf:
+                needs_fold = rf.getnchannels() > 1 and rf.getsampwidth() == 2
+        except (wave.Error, EOFError):
+            needs_fold = False
         with open(path, "rb") as f:
             raw = f.read()
-        return self._force_mono_wav_bytes(raw)
+        return self._force_mono_wav_bytes(raw) if needs_fold else raw
 
     def _force_mono_wav_bytes(self, wav_bytes: bytes) -> bytes:
         try:
@@ -1113,13 +1325,11 @@ class SmolSTTApp:
                 sw = int(rf.getsampwidth())
                 rate = int(rf.getframerate())
                 frames = int(rf.getnframes())
+                if ch <= 1 or sw != 2 or frames <= 0:
+                    return wav_bytes
                 raw = rf.readframes(frames)
-            if ch <= 1 or sw != 2 or frames <= 0:
-                return wav_bytes
             audio = np.frombuffer(raw, dtype=np.int16).reshape(-1, ch)
-            audio_f = audio.astype(np.float32)
-            strongest_idx = np.argmax(np.abs(audio_f), axis=1)
-            mono = audio_f[np.arange(audio_f.shape[0]), strongest_idx].astype(np.int16)
+            mono, _ = fold_max_abs(audio)
             out = io.BytesIO()
             with wave.open(out, "wb") as wf:
                 wf.setnchannels(1)
@@ -1141,12 +1351,12 @@ class SmolSTTApp:
         self._speed_stats_mode = normalized
 
     def _record_speed_stats(self, chars: int, elapsed_s: float) -> None:
-        now = time.time()
-        self._speed_samples.append((now, max(0, int(chars)), max(0.0, float(elapsed_s))))
+        now = time.monotonic_ns()
+        self._speed_samples.append((now, max(0, int(chars)), max(0, int(elapsed_s * 1e9))))
         self._prune_speed_samples(now)
 
-    def _prune_speed_samples(self, now: float | None = None) -> None:
-        cutoff = (time.time() if now is None else now) - 60.0
+    def _prune_speed_samples(self, now: int | None = None) -> None:
+        cutoff = (time.monotonic_ns() if now is None else now) - 60_000_000_000
         while self._speed_samples and self._speed_samples[0][0] < cutoff:
             self._speed_samples.popleft()
 
@@ -1160,22 +1370,24 @@ class SmolSTTApp:
             return ""
 
         if mode == "current":
-            _, chars, elapsed_s = self._speed_samples[-1]
-            cps = (chars / elapsed_s) if elapsed_s > 0 else 0.0
+            _, chars, elapsed_ns = self._speed_samples[-1]
+            elapsed_s = elapsed_ns / 1e9
+            cps = (chars / elapsed_s) if elapsed_ns > 0 else 0.0
             return f"{cps:.1f} cps | {elapsed_s:.2f} s"
         else:
             total_chars = sum(s[1] for s in self._speed_samples)
-            total_secs = sum(s[2] for s in self._speed_samples)
-            if total_secs <= 0:
+            total_ns = sum(s[2] for s in self._speed_samples)
+            if total_ns <= 0:
                 return ""
+            total_secs = total_ns / 1e9
             cps = total_chars / total_secs
             return f"{cps:.1f} cps avg | {total_secs:.2f} s"
 
     def _install_crash_logging(self):
         def _handle_exception(exc_type, exc, tb):
             try:
-                msg = "".join(traceback.format_exception(exc_type, exc, tb))
-                log.error("Unhandled exception:\n%s", msg)
+                # exc_info defers traceback formatting to the handler.
+                log.error("Unhandled exception", exc_info=(exc_type, exc, tb))
             except Exception:
                 pass
             try:
@@ -1200,19 +1412,31 @@ class SmolSTTApp:
         autostart_wanted = bool(new_settings.get("autostart"))
         autostart_changed = autostart_wanted != is_autostart_enabled()
 
+        old_model = self._settings.get("model")
         old_device = self._settings.get("model_device")
+        old_compute_type = self._settings.get("whisper_compute_type")
         old_portable = self._settings.get("portable_models")
         old_backend = self._settings.get("whisper_backend")
 
         self._settings.update(new_settings)
+        self._toast_cache = None
+        self._show_indicator = bool(self._settings.get("show_recording_indicator", True))
+        self._typing_delay = 1.0 / self._get_typing_speed()
         self._apply_theme()
 
+        # Each change picks a different worker; drop the old one instead of
+        # keeping its model resident next to the new one.
         if (
-            new_settings.get("model_device") != old_device
+            new_settings.get("model") != old_model
+            or new_settings.get("model_device") != old_device
+            or new_settings.get("whisper_compute_type") != old_compute_type
             or new_settings.get("portable_models") != old_portable
             or new_settings.get("whisper_backend") != old_backend
         ):
             self._local_engine.unload()
+            for engine, _ in self._blob_engines.values():
+                engine.unload()
+            self._blob_engines.clear()
 
         if hotkey_changed:
             self._register_hotkey()
@@ -1221,8 +1445,15 @@ class SmolSTTApp:
             set_autostart(autostart_wanted)
 
     def quit(self):
+        self._tx_pool.shutdown(wait=False, cancel_futures=True)
         self._hotkey_mgr.stop()
         self._system_hotkey_mgr.stop()
+        self._mod_release_pool.shutdown(wait=False, cancel_futures=True)
+        # Not cancelled: a clip still being written is finished first.
+        self._io_pool.shutdown(wait=False)
+        self._local_engine.unload()
+        for engine, _ in self._blob_engines.values():
+            engine.unload()
         self._tray.stop()
         self._ui.quit()
 
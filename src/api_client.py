@@ -1,23 +1,43 @@
-import io
 import requests
 
 from logger import log
 
 
-def ping(base_url: str, timeout: int = 5) -> tuple[bool, str]:
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Reused across pings so repeated checks against the same server keep
+# the connection alive instead of reconnecting each time.
+_ping_session = _new_session()
+
+
+def ping(base_url: str, timeout: int = 2) -> tuple[bool, str]:
     """Check whether the Whisper server is reachable. Returns (ok, message)."""
     base_url = base_url.rstrip("/")
     for path in ("/health", "/", "/docs"):
         url = base_url + path
-        log.debug("ping: GET %s", url)
+        log.debug("ping: HEAD %s", url)
         try:
-            r = requests.get(url, timeout=timeout)
+            # HEAD skips the body; only servers that reject it get a GET.
+            r = _ping_session.head(url, timeout=timeout, allow_redirects=False)
+            if r.status_code == 405:
+                log.debug("ping: HEAD not allowed, GET %s", url)
+                r = _ping_session.get(url, timeout=timeout)
+            if r.status_code == 404:
+                log.debug("ping: 404 — %s", url)
+                continue
             msg = f"OK  ({r.status_code})  —  {url}"
             log.info("ping: %s", msg)
             return True, msg
         except requests.exceptions.ConnectionError:
+            # Every path is on the same host; no point trying the others.
             log.warning("ping: connection refused — %s", url)
-            continue
+            break
         except requests.exceptions.Timeout:
             msg = f"Timeout after {timeout}s  —  {url}"
             log.warning("ping: %s", msg)
@@ -25,6 +45,11 @@ def ping(base_url: str, timeout: int = 5) -> tuple[bool, str]:
         except Exception as exc:
             log.error("ping: unexpected error — %s", exc)
             return False, str(exc)
+    else:
+        # Reachable, but none of the known paths exist; still a live server.
+        msg = f"OK  (404)  —  {base_url}"
+        log.info("ping: %s", msg)
+        return True, msg
 
     msg = f"Connection refused — is the server running?\nTried: {base_url}"
     log.error("ping: %s", msg)
@@ -42,18 +67,30 @@ class WhisperClient:
 
     def __init__(self, settings_manager):
         self._settings = settings_manager
+        # Shared session so the TCP connection is kept alive between requests.
+        self._session = _new_session()
+
+    def warmup(self, timeout: int = 3):
+        """Open a pooled connection to the server ahead of the first request."""
+        base_url = self._settings.get("api_url", "http://localhost:9876").rstrip("/")
+        try:
+            r = self._session.head(base_url + "/health", timeout=timeout)
+            log.debug("warmup: HEAD %s/health -> %d", base_url, r.status_code)
+        except Exception as exc:
+            log.debug("warmup: %s unreachable (%s)", base_url, exc)
 
     def transcribe(self, wav_bytes: bytes) -> str:
         base_url = self._settings.get("api_url", "http://localhost:9876").rstrip("/")
         endpoint = self._settings.get("api_endpoint", "/v1/audio/transcriptions").lstrip("/")
         language = self._settings.get("language", "").strip()
         model = self._settings.get("model", "whisper-1").strip() or "whisper-1"
+        response_format = (self._settings.get("api_response_format", "text") or "text").strip().lower()
 
         url = f"{base_url}/{endpoint}"
 
         form_data: dict[str, str] = {
             "model": model,
-            "response_format": "json",
+            "response_format": response_format,
         }
         if language and language.lower() != "auto":
             form_data["language"] = language
@@ -63,10 +100,12 @@ class WhisperClient:
             url, form_data, len(wav_bytes),
         )
 
-        files = {"file": ("recording.wav", io.BytesIO(wav_bytes), "audio/wav")}
+        # requests accepts the bytes directly; wrapping them in BytesIO only
+        # added a copy before the multipart body is built.
+        files = {"file": ("recording.wav", wav_bytes, "audio/wav")}
 
         try:
-            response = requests.post(url, data=form_data, files=files, timeout=60)
+            response = self._session.post(url, data=form_data, files=files, timeout=60)
             log.info(
                 "Response  status=%d  size=%d bytes",
                 response.status_code, len(response.content),
@@ -85,13 +124,21 @@ class WhisperClient:
             log.error("Request timed out after 60s")
             raise
 
-        text = self._extract_text(response)
+        text = self._extract_text(response, response_format)
         log.info("Transcription result: %r", text)
         return text
 
     # ------------------------------------------------------------------
 
-    def _extract_text(self, response) -> str:
+    def _extract_text(self, response, response_format: str = "json") -> str:
+        if response_format == "text":
+            # The body is the transcript; only parse it when the server
+            # ignored response_format and answered with JSON anyway (some
+            # servers also label JSON bodies as text/plain).
+            content_type = response.headers.get("Content-Type", "")
+            body = response.text.strip()
+            if "json" not in content_type and not body.startswith("{"):
+                return body
         try:
             data = response.json()
             log.debug("Parsed JSON response: %s", data)
@@ -0,0 +1,140 @@
+"""Small audio kernels used by the capture callbacks and clip analysis.
+
+numba is optional: when installed, warmup() swaps in JIT-compiled loops;
+otherwise the NumPy implementations are used.
+"""
+
+import numpy as np
+
+from logger import log
+
+try:
+    import numba
+
+    _NUMBA_OK = True
+except ImportError:
+    _NUMBA_OK = False
+    numba = None
+
+
+def _sum_squares_numpy(flat):
+    return np.dot(flat.astype(np.int64), flat)
+
+
+def _sum_squares_loop(flat):
+    total = np.int64(0)
+    for i in range(flat.shape[0]):
+        v = np.int64(flat[i])
+        total += v * v
+    return total
+
+
+def _level_stats_numpy(flat, threshold):
+    magnitude = np.abs(flat).view(np.uint16)  # -32768 reads as 32768
+    peak = int(magnitude.max()) if flat.shape[0] else 0
+    return _sum_squares(flat), np.count_nonzero(magnitude > threshold), peak
+
+
+def _level_stats_loop(flat, threshold):
+    # Sum of squares, samples above threshold and peak in a single pass.
+    total = np.int64(0)
+    active = 0
+    peak = 0
+    for i in range(flat.shape[0]):
+        v = np.int64(flat[i])
+        total += v * v
+        mag = abs(v)
+        if mag > threshold:
+            active += 1
+        if mag > peak:
+            peak = mag
+    return total, active, peak
+
+
+def _fold_numpy(audio):
+    # abs() of -32768 wraps in int16, but its bit pattern read as uint16 is
+    # 32768, so the comparison stays correct without widening the buffer.
+    if audio.shape[1] == 2:
+        # Stereo: a straight select, no argmax/gather. Ties keep the left
+        # channel, as argmax does.
+        left = audio[:, 0]
+        right = audio[:, 1]
+        louder_left = np.abs(left).view(np.uint16) >= np.abs(right).view(np.uint16)
+        mono = np.where(louder_left, left, right)
+        return mono, _sum_squares(mono)
+    idx = np.abs(audio).view(np.uint16).argmax(axis=1)
+    mono = np.take_along_axis(audio, idx[:, None], axis=1).reshape(-1)
+    return mono, _sum_squares(mono)
+
+
+def _fold_loop(audio):
+    # One pass: pick each frame's strongest channel and accumulate its square.
+    rows, cols = audio.shape
+    mono = np.empty(rows, dtype=np.int16)
+    total = np.int64(0)
+    for r in range(rows):
+        best = audio[r, 0]
+        best_mag = abs(np.int32(best))
+        for c in range(1, cols):
+            v = audio[r, c]
+            mag = abs(np.int32(v))
+            if mag > best_mag:
+                best = v
+                best_mag = mag
+        mono[r] = best
+        total += np.int64(best) * np.int64(best)
+    return mono, total
+
+
+_sum_squares = _sum_squares_numpy
+_level_stats = _level_stats_numpy
+_fold = _fold_numpy
+
+
+def warmup():
+    """Compile the numba kernels ahead of the first capture; no-op without numba."""
+    global _sum_squares, _level_stats, _fold
+    if not _NUMBA_OK or _sum_squares is not _sum_squares_numpy:
+        return
+    try:
+        jit = numba.njit(cache=True, boundscheck=False)
+        sum_kernel = jit(_sum_squares_loop)
+        stats_kernel = jit(_level_stats_loop)
+        fold_kernel = jit(_fold_loop)
+        sum_kernel(np.zeros(64, dtype=np.int16))
+        stats_kernel(np.zeros(64, dtype=np.int16), 600)
+        fold_kernel(np.zeros((64, 2), dtype=np.int16))
+    except Exception as exc:
+        # e.g. no writable cache location in a frozen build.
+        log.warning("numba audio kernels unavailable, using NumPy: %s", exc)
+        return
+    _sum_squares = sum_kernel
+    _level_stats = stats_kernel
+    _fold = fold_kernel
+    log.debug("numba audio kernels ready")
+
+
+def sum_squares_int16(block) -> int:
+    """Sum of squared int16 samples, accumulated in int64."""
+    return int(_sum_squares(block.reshape(-1)))
+
+
+def rms_int16(block) -> float:
+    """RMS of an int16 block on the int16 scale."""
+    flat = block.reshape(-1)
+    if flat.size == 0:
+        return 0.0
+    return (int(_sum_squares(flat)) / flat.size) ** 0.5
+
+
+def level_stats_int16(block, threshold: int) -> tuple[int, int, int]:
+    """Return (sum of squares, count of samples with |v| > threshold, peak |v|)."""
+    total, active, peak = _level_stats(block.reshape(-1), int(threshold))
+    return int(total), int(active), int(peak)
+
+
+def fold_max_abs(audio) -> tuple[np.ndarray, int]:
+    """Fold (frames, channels) int16 to mono by keeping each frame's strongest
+    sample. Returns the mono samples and their int64 sum of squares."""
+    mono, total = _fold(np.ascontiguousarray(audio))
+    return mono, int(total)
@@ -1,12 +1,26 @@
+import atexit
+import functools
 import sys
 import os
 
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
 from logger import log
 
 APP_NAME = "SmolSTT"
 _KEY_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
 
+# HKCU\...\Run handle, opened on first use and kept until exit.
+_run_key = None
+_run_key_writable = False
+# Last known presence of our Run value; set_autostart() refreshes it.
+_enabled_cache: bool | None = None
+
 
+@functools.lru_cache(maxsize=1)
 def _autostart_command() -> str:
     """Return the command stored in HKCU\\...\\Run for this app."""
     if getattr(sys, "frozen", False):
@@ -18,43 +32,67 @@ def _autostart_command() -> str:
     return f'"{exe}" "{script}"'
 
 
+def _close_run_key():
+    global _run_key, _run_key_writable
+    if _run_key is not None:
+        try:
+            winreg.CloseKey(_run_key)
+        except OSError:
+            pass
+    _run_key = None
+    _run_key_writable = False
+
+
+def _get_run_key(write: bool = False):
+    global _run_key, _run_key_writable
+    if winreg is None:
+        raise OSError("winreg is not available on this platform")
+    if _run_key is not None and (_run_key_writable or not write):
+        return _run_key
+    # A read-only handle is reopened with write access the first time it's needed.
+    _close_run_key()
+    access = winreg.KEY_READ | (winreg.KEY_SET_VALUE if write else 0)
+    _run_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, _KEY_PATH, 0, access)
+    _run_key_writable = write
+    return _run_key
+
+
+atexit.register(_close_run_key)
+
+
 def set_autostart(enabled: bool):
+    global _enabled_cache
+    _enabled_cache = None
     try:
-        import winreg
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            _KEY_PATH,
-            0,
-            winreg.KEY_SET_VALUE,
-        )
-        try:
-            if enabled:
-                cmd = _autostart_command()
-                winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, cmd)
-                log.debug("Autostart enabled: %s", cmd)
-            else:
-                try:
-                    winreg.DeleteValue(key, APP_NAME)
-                    log.debug("Autostart disabled.")
-                except FileNotFoundError:
-                    pass
-        finally:
-            winreg.CloseKey(key)
+        key = _get_run_key(write=True)
+        if enabled:
+            cmd = _autostart_command()
+            winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, cmd)
+            _enabled_cache = True
+            log.debug("Autostart enabled: %s", cmd)
+        else:
+            try:
+                winreg.DeleteValue(key, APP_NAME)
+                log.debug("Autostart disabled.")
+            except FileNotFoundError:
+                pass
+            _enabled_cache = False
     except Exception:
         log.exception("Failed to update autostart registry entry.")
 
 
 def is_autostart_enabled() -> bool:
+    global _enabled_cache
+    if _enabled_cache is not None:
+        return _enabled_cache
     try:
-        import winreg
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, _KEY_PATH)
+        key = _get_run_key()
         try:
             winreg.QueryValueEx(key, APP_NAME)
-            return True
+            _enabled_cache = True
         except FileNotFoundError:
-            return False
-        finally:
-            winreg.CloseKey(key)
+            _enabled_cache = False
+        return _enabled_cache
     except Exception:
         log.exception("Failed to read autostart registry entry.")
         return False
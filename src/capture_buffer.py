@@ -0,0 +1,136 @@
+import wave
+from collections import deque
+
+import numpy as np
+
+# Slabs kept on the free list after a reset; the rest are released.
+_MAX_FREE_SLABS = 8
+# Size of the header Python's wave module writes for 16-bit PCM.
+_WAV_HEADER_SIZE = 44
+
+
+class CaptureBuffer:
+    """
+    Append-only int16 PCM store for the test capture path.
+
+    Audio blocks are copied into fixed-size bytearray slabs instead of being
+    kept as one NumPy array per callback. Full slabs are sealed and new ones
+    come from a free list, so a long capture does no per-block allocation
+    and slabs are reused across captures.
+
+    After spill_to(), full slabs are written straight to a WAV file and
+    reused, so memory stays at one slab however long the capture runs.
+    """
+
+    def __init__(self, slab_bytes: int = 16000 * 2):
+        self._slab_bytes = max(2, int(slab_bytes) & ~1)
+        self._sealed: deque[bytearray] = deque()
+        self._free: list[bytearray] = []
+        self._cur = bytearray(self._slab_bytes)
+        self._cur_off = 0
+        self._spill = None
+        self._spill_path: str | None = None
+        self._spill_channels = 1
+        self._spilled = 0
+
+    def reset(self, slab_bytes: int | None = None):
+        """Drop captured audio, keeping slabs for reuse when the size is unchanged."""
+        self._close_spill()
+        self._spill_path = None
+        self._spilled = 0
+        if slab_bytes is not None:
+            slab_bytes = max(2, int(slab_bytes) & ~1)
+        if slab_bytes is not None and slab_bytes != self._slab_bytes:
+            self._slab_bytes = slab_bytes
+            self._sealed.clear()
+            self._free.clear()
+            self._cur = bytearray(slab_bytes)
+        else:
+            self._free.extend(self._sealed)
+            self._sealed.clear()
+            del self._free[_MAX_FREE_SLABS:]
+        self._cur_off = 0
+
+    def spill_to(self, path: str, sample_rate: int, channels: int = 1):
+        """Write full slabs to a 16-bit PCM WAV at `path` as they fill."""
+        self._close_spill()
+        channels = max(1, int(channels))
+        wf = wave.open(path, "wb")
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(int(sample_rate))
+        self._spill = wf
+        self._spill_path = path
+        self._spill_channels = channels
+        self._spilled = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._spilled + len(self._sealed) * self._slab_bytes + self._cur_off
+
+    def append(self, block):
+        """Copy a C-contiguous int16 block (ndarray or bytes-like) into the slabs."""
+        src = memoryview(block).cast("B")
+        pos = 0
+        total = len(src)
+        while pos < total:
+            n = min(self._slab_bytes - self._cur_off, total - pos)
+            self._cur[self._cur_off:self._cur_off + n] = src[pos:pos + n]
+            self._cur_off += n
+            pos += n
+            if self._cur_off == self._slab_bytes:
+                self._seal()
+
+    def _seal(self):
+        if self._spill is not None:
+            self._spill.writeframesraw(self._cur)
+            self._spilled += self._slab_bytes
+            self._cur_off = 0
+            return
+        self._sealed.append(self._cur)
+        self._cur = self._free.pop() if self._free else bytearray(self._slab_bytes)
+        self._cur_off = 0
+
+    def finish(self) -> str | None:
+        """Write the tail to the spill file and close it; returns its path, if any."""
+        if self._spill is None:
+            return None
+        frame_bytes = 2 * self._spill_channels
+        tail = self._cur_off - (self._cur_off % frame_bytes)
+        if tail:
+            self._spill.writeframesraw(memoryview(self._cur)[:tail])
+            self._spilled += tail
+        self._cur_off = 0
+        self._close_spill()
+        return self._spill_path
+
+    def _close_spill(self):
+        if self._spill is None:
+            return
+        try:
+            self._spill.close()
+        finally:
+            self._spill = None
+
+    def to_array(self, channels: int = 1) -> np.ndarray:
+        """Return everything captured as one (frames, channels) int16 array.
+
+        When spilling, call finish() first so the file is complete.
+        """
+        channels = max(1, int(channels))
+        frame_bytes = 2 * channels
+        usable = self.nbytes - (self.nbytes % frame_bytes)
+        out = np.empty(usable // 2, dtype=np.int16)
+        dst = memoryview(out).cast("B")
+        pos = 0
+        if self._spilled and self._spill_path:
+            with open(self._spill_path, "rb") as f:
+                f.seek(_WAV_HEADER_SIZE)
+                pos = f.readinto(dst[:min(self._spilled, usable)]) or 0
+        for slab in self._sealed:
+            n = min(len(slab), usable - pos)
+            dst[pos:pos + n] = memoryview(slab)[:n]
+            pos += n
+        if pos < usable:
+            dst[pos:usable] = memoryview(self._cur)[:usable - pos]
+        return out.reshape(-1, channels)
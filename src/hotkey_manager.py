@@ -4,42 +4,108 @@ Keyboard-only hotkeys use the `keyboard` library.
 Hotkeys that include mouse buttons (mouse1-5) use pynput.
 """
 
+import importlib.util
+import queue
+import sys
+import threading
+
 import keyboard
 
 from logger import log
 
-try:
-    from pynput import mouse as _pm
-    _PYNPUT_OK = True
-except ImportError:
-    _PYNPUT_OK = False
+# pynput is imported on the first mouse hotkey; keyboard-only setups never
+# pay for it at startup. find_spec only checks that it is installed.
+_PYNPUT_OK = importlib.util.find_spec("pynput") is not None
+if not _PYNPUT_OK:
     log.warning("pynput not installed — mouse button hotkeys unavailable")
+_pm = None
+
+_MOUSE_NAMES = frozenset({"mouse1", "mouse2", "mouse3", "mouse4", "mouse5"})
+_MOUSE_BUTTON_MAP: dict = {}
+
 
-_MOUSE_NAMES = {"mouse1", "mouse2", "mouse3", "mouse4", "mouse5"}
-_MOUSE_BUTTON_MAP = {
-    "mouse1": "_pm.Button.left",    # resolved at runtime
-    "mouse2": "_pm.Button.right",
-    "mouse3": "_pm.Button.middle",
-    "mouse4": "_pm.Button.x1",
-    "mouse5": "_pm.Button.x2",
+def _pynput_mouse():
+    """Import pynput.mouse on first use; None if it can't be loaded."""
+    global _pm, _PYNPUT_OK
+    if _pm is None and _PYNPUT_OK:
+        try:
+            from pynput import mouse
+        except Exception as exc:
+            _PYNPUT_OK = False
+            log.warning("pynput unavailable — mouse button hotkeys disabled: %s", exc)
+            return None
+        _MOUSE_BUTTON_MAP.update({
+            "mouse1": mouse.Button.left,
+            "mouse2": mouse.Button.right,
+            "mouse3": mouse.Button.middle,
+            "mouse4": mouse.Button.x1,
+            "mouse5": mouse.Button.x2,
+        })
+        _pm = mouse
+    return _pm
+
+
+# Low-level hook messages (down, up) per button, and the XBUTTON index
+# carried in the high word of mouseData for mouse4/mouse5.
+_WIN32_BUTTON_MESSAGES = {
+    "mouse1": ((0x0201, 0x0202), None),
+    "mouse2": ((0x0204, 0x0205), None),
+    "mouse3": ((0x0207, 0x0208), None),
+    "mouse4": ((0x020B, 0x020C), 1),
+    "mouse5": ((0x020B, 0x020C), 2),
 }
 
 
+def _win32_button_filter(name: str):
+    """pynput win32_event_filter that lets only `name`'s press/release through."""
+    messages, xbutton = _WIN32_BUTTON_MESSAGES[name]
+
+    def _filter(msg, data):
+        # Returning False stops pynput from translating the event and calling
+        # into the listener; moves and other buttons end here.
+        if msg not in messages:
+            return False
+        return xbutton is None or (data.mouseData >> 16) == xbutton
+
+    return _filter
+
+
 def _resolve_mouse_button(name: str):
-    return {
-        "mouse1": _pm.Button.left,
-        "mouse2": _pm.Button.right,
-        "mouse3": _pm.Button.middle,
-        "mouse4": _pm.Button.x1,
-        "mouse5": _pm.Button.x2,
-    }.get(name)
+    return _MOUSE_BUTTON_MAP.get(name)
+
+
+def _split_hotkey(hotkey: str) -> tuple[list[str], str | None]:
+    """Lower-cased combo tokens and the mouse button among them, in one pass."""
+    parts = []
+    mouse_name = None
+    for token in hotkey.split("+"):
+        token = token.strip().lower()
+        parts.append(token)
+        if mouse_name is None and token in _MOUSE_NAMES:
+            mouse_name = token
+    return parts, mouse_name
+
+
+def _modifier_scan_codes(modifiers) -> tuple[tuple, ...]:
+    """Scan codes for each modifier, resolved once; a name is kept if it can't be mapped."""
+    resolved = []
+    for name in modifiers:
+        try:
+            codes = tuple(keyboard.key_to_scan_codes(name))
+        except (ValueError, KeyError):
+            codes = ()
+        resolved.append(codes or (name,))
+    return tuple(resolved)
 
 
 class HotkeyManager:
     def __init__(self):
         self._hotkey: str | None = None
+        # Handles from keyboard.add_hotkey, removed individually on unregister.
+        self._owned_hooks: list = []
         self._release_hook = None
         self._mouse_listener = None
+        self._mouse_events: queue.SimpleQueue | None = None
         self._held = False
 
     # ── Public API ────────────────────────────────────────────────────
@@ -62,12 +128,11 @@ class HotkeyManager:
         self._hotkey = hotkey
         self._held = False
 
-        parts = [p.strip().lower() for p in hotkey.split("+")]
-        has_mouse = any(p in _MOUSE_NAMES for p in parts)
+        parts, mouse_name = _split_hotkey(hotkey)
 
-        if has_mouse:
-            if _PYNPUT_OK:
-                self._register_mouse(parts, on_activate, on_deactivate, mode)
+        if mouse_name is not None:
+            if _pynput_mouse() is not None:
+                self._register_mouse(parts, mouse_name, on_activate, on_deactivate, mode)
             else:
                 log.error(
                     "Cannot register mouse hotkey %r — pynput not installed", hotkey
@@ -78,12 +143,13 @@ class HotkeyManager:
             self._register_keyboard_toggle(hotkey, on_activate, suppress=suppress)
 
     def unregister(self):
-        if self._hotkey:
+        for handle in self._owned_hooks:
             try:
-                keyboard.remove_hotkey(self._hotkey)
+                keyboard.remove_hotkey(handle)
             except Exception:
                 pass
-            self._hotkey = None
+        self._owned_hooks.clear()
+        self._hotkey = None
 
         if self._release_hook:
             try:
@@ -99,20 +165,22 @@ class HotkeyManager:
                 pass
             self._mouse_listener = None
 
+        if self._mouse_events is not None:
+            self._mouse_events.put(None)  # ends the dispatcher thread
+            self._mouse_events = None
+
         self._held = False
 
     def stop(self):
+        # Only our own hooks: unhook_all() would also drop every other
+        # keyboard hook in the process, including other managers'.
         self.unregister()
-        try:
-            keyboard.unhook_all()
-        except Exception:
-            pass
 
     # ── Keyboard-only registration ────────────────────────────────────
 
     def _register_keyboard_toggle(self, hotkey: str, callback, suppress: bool = False):
         log.debug("Registering keyboard toggle: %s suppress=%s", hotkey, suppress)
-        keyboard.add_hotkey(hotkey, callback, suppress=bool(suppress))
+        self._owned_hooks.append(keyboard.add_hotkey(hotkey, callback, suppress=bool(suppress)))
 
     def _register_keyboard_hold(
         self, hotkey: str, parts: list[str], on_press, on_release, suppress: bool = False
@@ -132,17 +200,17 @@ class HotkeyManager:
                 log.debug("Hold hotkey released: %s", hotkey)
                 on_release()
 
-        keyboard.add_hotkey(hotkey, _activate, suppress=bool(suppress))
+        self._owned_hooks.append(keyboard.add_hotkey(hotkey, _activate, suppress=bool(suppress)))
 
         self._release_hook = keyboard.on_release(_check_release)
 
     # ── Mouse-button hotkey registration ─────────────────────────────
 
     def _register_mouse(
-        self, parts: list[str], on_activate, on_deactivate, mode: str
+        self, parts: list[str], mouse_name: str, on_activate, on_deactivate, mode: str
     ):
-        modifiers = [p for p in parts if p not in _MOUSE_NAMES]
-        mouse_name = next(p for p in parts if p in _MOUSE_NAMES)
+        # Fixed at registration; the click callback only walks this tuple.
+        modifiers = tuple(p for p in parts if p not in _MOUSE_NAMES)
         target_btn = _resolve_mouse_button(mouse_name)
 
         log.debug(
@@ -150,11 +218,15 @@ class HotkeyManager:
             mouse_name, modifiers, mode,
         )
 
+        mod_codes = _modifier_scan_codes(modifiers)
+
         def _mods_ok():
-            return all(keyboard.is_pressed(m) for m in modifiers)
+            # is_pressed() on a scan code is a set lookup in keyboard's own
+            # hook state; on a name it re-parses the hotkey string each call.
+            return all(any(keyboard.is_pressed(c) for c in codes) for codes in mod_codes)
 
-        def _on_click(x, y, button, pressed):
-            if button != target_btn or not _mods_ok():
+        def _handle(pressed):
+            if not _mods_ok():
                 return
 
             if mode == "toggle":
@@ -179,5 +251,28 @@ class HotkeyManager:
                     if on_deactivate:
                         on_deactivate()
 
-        self._mouse_listener = _pm.Listener(on_click=_on_click)
+        events: queue.SimpleQueue = queue.SimpleQueue()
+
+        def _dispatch():
+            while True:
+                pressed = events.get()
+                if pressed is None:
+                    return
+                try:
+                    _handle(pressed)
+                except Exception:
+                    log.exception("Mouse hotkey handler failed: %s", mouse_name)
+
+        def _on_click(x, y, button, pressed):
+            # Runs inside the low-level mouse hook; the OS waits on it for
+            # every click system-wide, so only filter and hand off.
+            if button == target_btn:
+                events.put(pressed)
+
+        self._mouse_events = events
+        threading.Thread(target=_dispatch, name="smolstt-mouse-hotkey", daemon=True).start()
+        listener_kwargs = {}
+        if sys.platform == "win32" and mouse_name in _WIN32_BUTTON_MESSAGES:
+            listener_kwargs["win32_event_filter"] = _win32_button_filter(mouse_name)
+        self._mouse_listener = _pynput_mouse().Listener(on_click=_on_click, **listener_kwargs)
         self._mouse_listener.start()
@@ -1,19 +1,22 @@
+import functools
+import importlib.util
+import sys
+
 import keyboard
 from PyQt6 import QtCore, QtWidgets
 
 from logger import log
+from raw_input import read_key_event, register_keyboard_sink, unregister_keyboard_sink
 
-try:
-    from pynput import keyboard as _pk
-    from pynput import mouse as _pm
-
-    _PYNPUT_OK = True
-except ImportError:
-    _PYNPUT_OK = False
-    _pk = None
-    _pm = None
+# pynput is only imported once recording starts (see _load_pynput); at
+# import time it is enough to know whether it is installed.
+_PYNPUT_OK = importlib.util.find_spec("pynput") is not None
+_pk = None
+_pm = None
 
-_MOD_ORDER = ["ctrl", "shift", "alt", "windows"]
+_MOD_ORDER = ("ctrl", "shift", "alt", "windows")
+_MOD_SET = frozenset(_MOD_ORDER)  # membership checks; _MOD_ORDER keeps display order
+_MOD_BITS = {name: 1 << i for i, name in enumerate(_MOD_ORDER)}
 
 _MAIN_KEYS = [
     "space",
@@ -54,6 +57,97 @@ _MAIN_KEYS += [
 ]
 if _PYNPUT_OK:
     _MAIN_KEYS += ["mouse1", "mouse2", "mouse3", "mouse4", "mouse5"]
+# Frozen once built: the tuple feeds the combo box, the set answers lookups.
+_MAIN_KEYS = tuple(sys.intern(key) for key in _MAIN_KEYS)
+_MAIN_KEY_SET = frozenset(_MAIN_KEYS)
+
+# Listener callbacks run inside the OS input hook; these lookups are filled
+# once by _load_pynput() rather than per event.
+_PYNPUT_KEY_NAMES: dict = {}
+_PYNPUT_BUTTON_NAMES: dict = {}
+
+
+def _load_pynput() -> bool:
+    """Import pynput and build its name tables on first use."""
+    global _pk, _pm, _PYNPUT_OK
+    if _pk is not None:
+        return True
+    if not _PYNPUT_OK:
+        return False
+    try:
+        from pynput import keyboard as pk
+        from pynput import mouse as pm
+    except Exception as exc:
+        _PYNPUT_OK = False
+        log.warning("pynput unavailable, using fallback key capture: %s", exc)
+        return False
+    _PYNPUT_KEY_NAMES.update({
+        pk.Key.ctrl_l: "ctrl",
+        pk.Key.ctrl_r: "ctrl",
+        pk.Key.shift: "shift",
+        pk.Key.shift_r: "shift",
+        pk.Key.alt_l: "alt",
+        pk.Key.alt_r: "alt",
+        pk.Key.alt_gr: "alt",
+        pk.Key.cmd: "windows",
+        pk.Key.cmd_r: "windows",
+        pk.Key.space: "space",
+        pk.Key.enter: "enter",
+        pk.Key.tab: "tab",
+        pk.Key.esc: "esc",
+        pk.Key.backspace: "backspace",
+        pk.Key.delete: "delete",
+        pk.Key.insert: "insert",
+        pk.Key.home: "home",
+        pk.Key.end: "end",
+        pk.Key.page_up: "page up",
+        pk.Key.page_down: "page down",
+        pk.Key.up: "up",
+        pk.Key.down: "down",
+        pk.Key.left: "left",
+        pk.Key.right: "right",
+    })
+    _PYNPUT_BUTTON_NAMES.update({
+        pm.Button.left: "mouse1",
+        pm.Button.right: "mouse2",
+        pm.Button.middle: "mouse3",
+        pm.Button.x1: "mouse4",
+        pm.Button.x2: "mouse5",
+    })
+    _pk, _pm = pk, pm
+    return True
+
+
+_KEY_ALIASES = {
+    "left ctrl": "ctrl",
+    "right ctrl": "ctrl",
+    "left shift": "shift",
+    "right shift": "shift",
+    "left alt": "alt",
+    "right alt": "alt",
+    "alt gr": "alt",
+    "left windows": "windows",
+    "right windows": "windows",
+    "escape": "esc",
+    "return": "enter",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _canonical_key(name: str) -> str | None:
+    # Memoized: key repeat sends the same few names over and over. Results
+    # are interned so the pressed-set and _MOD_SET checks compare by identity first.
+    raw = name.strip().lower()
+    alias = _KEY_ALIASES.get(raw)
+    if alias is not None:
+        return alias
+    if raw in _MOD_SET or raw in _MAIN_KEY_SET:
+        return sys.intern(raw)
+    if len(raw) == 1 and (raw.isalpha() or raw.isdigit()):
+        return sys.intern(raw)
+    if raw.startswith("numpad "):
+        return sys.intern("num " + raw[len("numpad "):])
+    return None
 
 
 class HotkeyPickerDialog(QtWidgets.QDialog):
@@ -64,17 +158,26 @@ class HotkeyPickerDialog(QtWidgets.QDialog):
         self.setMinimumWidth(560)
 
         self._recording = False
-        self._pressed: set[str] = set()
+        # Held modifiers as _MOD_BITS flags plus the held non-modifier key.
+        self._mod_mask = 0
+        self._trigger: str | None = None
+        self._held: set[str] = set()  # every non-modifier still down
         self._has_trigger = False
         self._kb_listener = None
         self._mouse_listener = None
         self._keyboard_hook = None
+        self._raw_input = False
+        # At most one queued refresh/lock at a time; key repeat would
+        # otherwise post a timer per event.
+        self._refresh_pending = False
+        self._lock_pending = False
 
         layout = QtWidgets.QVBoxLayout(self)
 
         row = QtWidgets.QHBoxLayout()
         row.addWidget(QtWidgets.QLabel("Combination:"))
         self._combo = QtWidgets.QLineEdit(current)
+        self._combo.editingFinished.connect(self._on_combo_edited)
         row.addWidget(self._combo, 1)
         self._record_btn = QtWidgets.QPushButton("Record")
         self._record_btn.clicked.connect(self._toggle_record)
@@ -87,9 +190,12 @@ class HotkeyPickerDialog(QtWidgets.QDialog):
         mod_box = QtWidgets.QGroupBox("Modifiers")
         mod_layout = QtWidgets.QHBoxLayout(mod_box)
         self._mod_checks: dict[str, QtWidgets.QCheckBox] = {}
+        # Checked modifiers mirrored as _MOD_BITS flags, so a manual edit
+        # rebuilds the combo without querying every checkbox.
+        self._manual_mask = 0
         for name in _MOD_ORDER:
             cb = QtWidgets.QCheckBox(name.capitalize())
-            cb.toggled.connect(self._on_manual_change)
+            cb.toggled.connect(lambda checked, bit=_MOD_BITS[name]: self._on_mod_toggled(bit, checked))
             self._mod_checks[name] = cb
             mod_layout.addWidget(cb)
         layout.addWidget(mod_box)
@@ -98,8 +204,13 @@ class HotkeyPickerDialog(QtWidgets.QDialog):
         key_row.addWidget(QtWidgets.QLabel("Main key:"))
         self._main_key = QtWidgets.QComboBox()
         self._main_key.setEditable(True)
-        self._main_key.addItems(_MAIN_KEYS)
-        self._main_key.currentTextChanged.connect(self._on_manual_change)
+        self._main_key.addItems(list(_MAIN_KEYS))
+        # Typing fires a signal per keystroke; rebuild the combo once the burst settles.
+        self._main_key_timer = QtCore.QTimer(self)
+        self._main_key_timer.setSingleShot(True)
+        self._main_key_timer.setInterval(50)
+        self._main_key_timer.timeout.connect(self._on_manual_change)
+        self._main_key.currentTextChanged.connect(lambda _text: self._main_key_timer.start())
         key_row.addWidget(self._main_key, 1)
         layout.addLayout(key_row)
 
@@ -124,6 +235,10 @@ class HotkeyPickerDialog(QtWidgets.QDialog):
 
     def accept(self):
         self._stop_record()
+        if self._main_key_timer.isActive():
+            # Apply an edit still inside the debounce window.
+            self._main_key_timer.stop()
+            self._on_manual_change()
         super().accept()
 
     def reject(self):
@@ -136,22 +251,45 @@ class HotkeyPickerDialog(QtWidgets.QDialog):
 
     def _apply_combo_to_controls(self, combo: str):
         parts = [p.strip().lower() for p in combo.split("+") if p.strip()]
-        mods = set(p for p in parts if p in _MOD_ORDER)
-        main = next((p for p in reversed(parts) if p not in _MOD_ORDER), "")
+        mask = 0
+        main = ""
+        for p in parts:
+            bit = _MOD_BITS.get(p)
+            if bit:
+                mask |= bit
+            else:
+                main = p
+        self._manual_mask = mask
         for name, cb in self._mod_checks.items():
             cb.blockSignals(True)
-            cb.setChecked(name in mods)
+            cb.setChecked(bool(mask & _MOD_BITS[name]))
             cb.blockSignals(False)
+        self._main_key_timer.stop()
         self._main_key.blockSignals(True)
         self._main_key.setCurrentText(main)
         self._main_key.blockSignals(False)
 
+    def _on_mod_toggled(self, bit: int, checked: bool):
+        if checked:
+            self._manual_mask |= bit
+        else:
+            self._manual_mask &= ~bit
+        self._on_manual_change()
+
+    def _on_combo_edited(self):
+        # Typed straight into the combination box: sync the controls once.
+        if not self._recording:
+            self._apply_combo_to_controls(self._combo.text())
+
     def _on_manual_change(self):
         if self._recording:
             return
-        mods = [name for name in _MOD_ORDER if self._mod_checks[name].isChecked()]
+        mask = self._manual_mask
+        parts = [name for name in _MOD_ORDER if mask & _MOD_BITS[name]]
         main = self._main_key.currentText().strip().lower()
-        self._combo.setText("+".join(mods + ([main] if main else [])))
+        if main:
+            parts.append(main)
+        self._combo.setText("+".join(parts))
 
     def _toggle_record(self):
         if self._recording:
@@ -161,26 +299,58 @@ class HotkeyPickerDialog(QtWidgets.QDialog):
 
     def _start_record(self):
         self._recording = True
-        self._pressed.clear()
+        self._mod_mask = 0
+        self._trigger = None
+        self._held.clear()
         self._has_trigger = False
         self._combo.setText("")
         self._combo.setReadOnly(True)
         self._record_btn.setText("Stop")
         self._status.setText("Listening... press combo and release to lock.")
-        QtCore.QTimer.singleShot(200, self._attach_listeners)
+        # Attached right away: the Record click has already been released by
+        # the time clicked fires, and a stray release with nothing pressed
+        # is ignored by _key_up.
+        self._attach_listeners()
+
+    def _prepare_listeners(self):
+        # The first recording builds them (and imports pynput); after that the
+        # next pair is built ahead of time (pynput threads are single-use) so a
+        # new recording only has to call start().
+        if self._kb_listener is None and _load_pynput():
+            self._kb_listener = _pk.Listener(on_press=self._on_pynput_key_press, on_release=self._on_pynput_key_release)
+            self._mouse_listener = _pm.Listener(on_click=self._on_mouse_click)
 
     def _attach_listeners(self):
         if not self._recording:
             return
 
-        if _PYNPUT_OK:
-            self._kb_listener = _pk.Listener(on_press=self._on_pynput_key_press, on_release=self._on_pynput_key_release)
-            self._mouse_listener = _pm.Listener(on_click=self._on_mouse_click)
+        self._prepare_listeners()
+        if self._kb_listener is not None:
             self._kb_listener.start()
             self._mouse_listener.start()
+        elif register_keyboard_sink(int(self.winId())):
+            # Raw input lands on this window's own message queue, so no
+            # hook thread sits between the keyboard and the Qt loop.
+            self._raw_input = True
         else:
             self._keyboard_hook = keyboard.hook(self._on_keyboard_event)
 
+    def nativeEvent(self, event_type, message):
+        if self._raw_input and bytes(event_type) == b"windows_generic_MSG":
+            try:
+                event = read_key_event(int(message))
+            except Exception:
+                event = None
+            if event is not None:
+                name, pressed = event
+                key = self._canonical_name(name)
+                if key:
+                    if pressed:
+                        self._key_down(key)
+                    else:
+                        self._key_up(key)
+        return super().nativeEvent(event_type, message)
+
     def _stop_record(self):
         if not self._recording:
             return
@@ -197,6 +367,10 @@ class HotkeyPickerDialog(QtWidgets.QDialog):
         if self._keyboard_hook:
             keyboard.unhook(self._keyboard_hook)
             self._keyboard_hook = None
+        if self._raw_input:
+            unregister_keyboard_sink()
+            self._raw_input = False
+        self._prepare_listeners()
 
         combo = self._combo.text().strip().lower()
         if combo:
@@ -210,127 +384,87 @@ class HotkeyPickerDialog(QtWidgets.QDialog):
         if not key:
             return
         if event.event_type == "down":
-            self._pressed.add(key)
-            if key not in _MOD_ORDER:
-                self._has_trigger = True
-            self._refresh_display_async()
+            self._key_down(key)
         elif event.event_type == "up":
-            self._pressed.discard(key)
-            if not self._pressed and self._has_trigger:
-                self._lock_combo_async()
+            self._key_up(key)
 
     def _on_pynput_key_press(self, key):
         name = self._resolve_pynput_key(key)
         if name:
-            self._pressed.add(name)
-            if name not in _MOD_ORDER:
-                self._has_trigger = True
-            self._refresh_display_async()
+            self._key_down(name)
 
     def _on_pynput_key_release(self, key):
-        name = self._resolve_pynput_key(key)
-        if name:
-            self._pressed.discard(name)
-        if not self._pressed and self._has_trigger:
-            self._lock_combo_async()
+        self._key_up(self._resolve_pynput_key(key))
 
     def _on_mouse_click(self, _x, _y, button, pressed):
         if _pm is None:
             return
-        btn_map = {
-            _pm.Button.left: "mouse1",
-            _pm.Button.right: "mouse2",
-            _pm.Button.middle: "mouse3",
-            _pm.Button.x1: "mouse4",
-            _pm.Button.x2: "mouse5",
-        }
-        name = btn_map.get(button)
+        name = _PYNPUT_BUTTON_NAMES.get(button)
         if not name:
             return
         if pressed:
-            self._pressed.add(name)
-            self._has_trigger = True
-            self._refresh_display_async()
+            self._key_down(name)
         else:
-            self._pressed.discard(name)
-            if not self._pressed and self._has_trigger:
-                self._lock_combo_async()
+            self._key_up(name)
+
+    def _key_down(self, name: str):
+        bit = _MOD_BITS.get(name)
+        if bit:
+            self._mod_mask |= bit
+        else:
+            self._trigger = name
+            self._held.add(name)
+            self._has_trigger = True
+        self._refresh_display_async()
+
+    def _key_up(self, name: str | None):
+        bit = _MOD_BITS.get(name)
+        if bit:
+            self._mod_mask &= ~bit
+        elif name is not None:
+            self._held.discard(name)
+            if name == self._trigger:
+                self._trigger = next(iter(self._held), None)
+        # Lock only once everything is released, not when the trigger alone is.
+        if not self._mod_mask and not self._held and self._has_trigger:
+            self._lock_combo_async()
 
     def _refresh_display_async(self):
-        QtCore.QTimer.singleShot(0, self._refresh_display)
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QtCore.QTimer.singleShot(0, self._flush_refresh)
+
+    def _flush_refresh(self):
+        self._refresh_pending = False
+        self._refresh_display()
 
     def _lock_combo_async(self):
-        QtCore.QTimer.singleShot(0, self._stop_record)
+        if not self._lock_pending:
+            self._lock_pending = True
+            QtCore.QTimer.singleShot(0, self._flush_lock)
+
+    def _flush_lock(self):
+        self._lock_pending = False
+        self._stop_record()
 
     def _refresh_display(self):
-        mods = [name for name in _MOD_ORDER if name in self._pressed]
-        others = sorted(name for name in self._pressed if name not in _MOD_ORDER)
-        combo = "+".join(mods + (others[:1] if others else []))
-        self._combo.setText(combo)
+        mask = self._mod_mask
+        parts = [name for name in _MOD_ORDER if mask & _MOD_BITS[name]]
+        if self._trigger:
+            parts.append(self._trigger)
+        self._combo.setText("+".join(parts))
 
     def _canonical_name(self, name: str | None) -> str | None:
         if not name:
             return None
-        raw = name.strip().lower()
-        aliases = {
-            "left ctrl": "ctrl",
-            "right ctrl": "ctrl",
-            "left shift": "shift",
-            "right shift": "shift",
-            "left alt": "alt",
-            "right alt": "alt",
-            "alt gr": "alt",
-            "left windows": "windows",
-            "right windows": "windows",
-            "escape": "esc",
-            "return": "enter",
-        }
-        if raw in aliases:
-            return aliases[raw]
-        if raw in _MOD_ORDER or raw in _MAIN_KEYS:
-            return raw
-        if len(raw) == 1 and (raw.isalpha() or raw.isdigit()):
-            return raw
-        if raw.startswith("numpad "):
-            return "num " + raw.replace("numpad ", "")
-        return None
+        return _canonical_key(name)
 
     def _resolve_pynput_key(self, key) -> str | None:
         if _pk is None:
             return None
-        mod_map = {
-            _pk.Key.ctrl_l: "ctrl",
-            _pk.Key.ctrl_r: "ctrl",
-            _pk.Key.shift: "shift",
-            _pk.Key.shift_r: "shift",
-            _pk.Key.alt_l: "alt",
-            _pk.Key.alt_r: "alt",
-            _pk.Key.alt_gr: "alt",
-            _pk.Key.cmd: "windows",
-            _pk.Key.cmd_r: "windows",
-        }
-        if key in mod_map:
-            return mod_map[key]
-
-        special = {
-            _pk.Key.space: "space",
-            _pk.Key.enter: "enter",
-            _pk.Key.tab: "tab",
-            _pk.Key.esc: "esc",
-            _pk.Key.backspace: "backspace",
-            _pk.Key.delete: "delete",
-            _pk.Key.insert: "insert",
-            _pk.Key.home: "home",
-            _pk.Key.end: "end",
-            _pk.Key.page_up: "page up",
-            _pk.Key.page_down: "page down",
-            _pk.Key.up: "up",
-            _pk.Key.down: "down",
-            _pk.Key.left: "left",
-            _pk.Key.right: "right",
-        }
-        if key in special:
-            return special[key]
+        name = _PYNPUT_KEY_NAMES.get(key)
+        if name is not None:
+            return name
 
         vk = getattr(key, "vk", None)
         if isinstance(vk, int) and 96 <= vk <= 105:
@@ -2,12 +2,17 @@
 Local inference engine for Parakeet (onnx-asr) and Whisper (faster-whisper) models.
 """
 
+import collections
+import ctypes
 import functools
+import importlib.metadata
 import json
 import os
+import queue
+import struct
 import subprocess
 import sys
-import tempfile
+import threading
 import time
 
 from logger import log
@@ -25,6 +30,12 @@ def _no_window_kwargs() -> dict:
 ONNX_MODEL_IDS = {
     "parakeet-tdt-0.6b-v3": "nemo-parakeet-tdt-0.6b-v3",
     "parakeet-tdt-0.6b-v3-fp32": "istupakov/parakeet-tdt-0.6b-v3-onnx",
+    "parakeet-tdt-0.6b-v3-int8": "nemo-parakeet-tdt-0.6b-v3",
+}
+
+# onnx_asr quantization variant to load; the int8 files are about 4x smaller.
+ONNX_MODEL_QUANTIZATION = {
+    "parakeet-tdt-0.6b-v3-int8": "int8",
 }
 
 FASTER_WHISPER_IDS = {
@@ -44,79 +55,457 @@ FASTER_WHISPER_IDS = {
 }
 
 
+@functools.lru_cache(maxsize=64)
 def is_parakeet_model(name: str) -> bool:
     return name.strip().startswith("parakeet-")
 
 
+@functools.lru_cache(maxsize=64)
 def is_whisper_model(name: str) -> bool:
     return name.strip().startswith("whisper-")
 
 
-@functools.lru_cache(maxsize=1)
-def _cuda_available() -> bool:
-    """Fast GPU presence check via nvidia-smi. Never loads CUDA DLLs."""
+def _nvml_driver_version() -> str:
+    """Query NVML directly; raises OSError when the library isn't installed."""
+    if sys.platform == "win32":
+        candidates = [
+            "nvml.dll",
+            os.path.join(os.environ.get("ProgramFiles", r"C:\Program Files"), "NVIDIA Corporation", "NVSMI", "nvml.dll"),
+        ]
+    else:
+        candidates = ["libnvidia-ml.so.1"]
+    lib = None
+    for name in candidates:
+        try:
+            lib = ctypes.CDLL(name)
+            break
+        except OSError:
+            continue
+    if lib is None:
+        raise OSError("NVML library not found")
+    if lib.nvmlInit_v2() != 0:
+        return ""
     try:
-        r = subprocess.run(
-            ["nvidia-smi", "-L"],
-            capture_output=True,
-            timeout=5,
-            **_no_window_kwargs(),
-        )
-        return r.returncode == 0 and bool(r.stdout.strip())
-    except Exception:
-        return False
+        count = ctypes.c_uint()
+        if lib.nvmlDeviceGetCount_v2(ctypes.byref(count)) != 0 or count.value == 0:
+            return ""
+        buf = ctypes.create_string_buffer(96)
+        if lib.nvmlSystemGetDriverVersion(buf, len(buf)) != 0:
+            return "unknown"
+        return buf.value.decode("ascii", errors="replace") or "unknown"
+    finally:
+        lib.nvmlShutdown()
 
 
 @functools.lru_cache(maxsize=1)
-def _ctranslate2_cuda_ok() -> bool:
-    """
-    Probe CTranslate2 CUDA support in a child process.
-    If CTranslate2 crashes with an access violation, only the child process dies.
-    """
-    if not _cuda_available():
-        return False
+def _nvidia_driver_version() -> str:
+    """NVIDIA driver version, or "" without a usable GPU. Never loads CUDA DLLs."""
+    try:
+        return _nvml_driver_version()
+    except OSError:
+        pass
+    except Exception:
+        return ""
     try:
         r = subprocess.run(
-            [
-                sys.executable,
-                "-c",
-                "import ctranslate2; "
-                "n = ctranslate2.get_cuda_device_count(); "
-                "exit(0 if n > 0 else 1)",
-            ],
+            ["nvidia-smi", "--query-gpu=driver_version", "--format=csv,noheader"],
             capture_output=True,
-            timeout=30,
+            text=True,
+            timeout=5,
             **_no_window_kwargs(),
         )
-        return r.returncode == 0
     except Exception:
-        return False
+        return ""
+    lines = (r.stdout or "").strip().splitlines()
+    return lines[0].strip() if r.returncode == 0 and lines else ""
+
 
+def _cuda_available() -> bool:
+    return bool(_nvidia_driver_version())
 
-@functools.lru_cache(maxsize=32)
-def _whisper_cuda_load_ok(model_id: str, compute_type: str) -> bool:
+
+@functools.lru_cache(maxsize=1)
+def _runtime_fingerprint() -> str:
+    """Identifies the driver + interpreter + CTranslate2 combo the CUDA probes ran against."""
+    try:
+        ct2 = importlib.metadata.version("ctranslate2")
+    except importlib.metadata.PackageNotFoundError:
+        ct2 = ""
+    return f"{_nvidia_driver_version()}|{os.path.abspath(sys.executable)}|{ct2}"
+
+
+# How long a failed CUDA probe is trusted before it is run again.
+_FAILED_PROBE_TTL_S = 600.0
+
+# Preferred CUDA compute types when "auto" is configured: INT8 weights with
+# FP16 activations where the GPU allows INT8, plain half precision otherwise.
+_CUDA_COMPUTE_PREFERENCE = ("int8_float16", "float16", "bfloat16")
+
+# Reports CTranslate2's CUDA compute types first, then tries the model load,
+# so a crash during the load still leaves the first line readable. Only a
+# model already in the cache is loaded; otherwise load_ok is null ("unknown").
+_WHISPER_CUDA_PROBE_CODE = (
+    "import json, sys\n"
+    "import ctranslate2\n"
+    "model_id, compute_type, preference = sys.argv[1], sys.argv[2], sys.argv[3].split(',')\n"
+    "types = []\n"
+    "if ctranslate2.get_cuda_device_count() > 0:\n"
+    "    types = sorted(ctranslate2.get_supported_compute_types('cuda'))\n"
+    "if compute_type == 'auto':\n"
+    "    compute_type = next((t for t in preference if t in types), 'auto')\n"
+    "print(json.dumps({'compute_types': types, 'compute_type': compute_type}), flush=True)\n"
+    "if not types or (compute_type != 'auto' and compute_type not in types):\n"
+    "    sys.exit(1)\n"
+    "from faster_whisper import WhisperModel, download_model\n"
+    "try:\n"
+    "    model_path = download_model(model_id, local_files_only=True)\n"
+    "except Exception:\n"
+    "    print(json.dumps({'load_ok': None}), flush=True)\n"
+    "    sys.exit(0)\n"
+    "WhisperModel(model_path, device='cuda', compute_type=compute_type)\n"
+    "print(json.dumps({'load_ok': True}), flush=True)\n"
+)
+
+
+def _whisper_cuda_probe(model_id: str, compute_type: str) -> dict:
     """
-    Probe faster-whisper model load on CUDA in a child process.
+    Probe CTranslate2 CUDA support and a faster-whisper CUDA load in one child
+    process. Returns {"compute_types", "compute_type", "load_ok"}, with "auto"
+    resolved against _CUDA_COMPUTE_PREFERENCE. load_ok is None when the model
+    isn't downloaded yet, so the load couldn't be tried.
     If native code crashes, only the child dies and we can safely fall back.
     """
+    result = {"compute_types": [], "compute_type": compute_type, "load_ok": False}
     try:
         r = subprocess.run(
             [
                 sys.executable,
                 "-c",
-                (
-                    "from faster_whisper import WhisperModel; "
-                    f"WhisperModel({model_id!r}, device='cuda', compute_type={compute_type!r}); "
-                    "exit(0)"
-                ),
+                _WHISPER_CUDA_PROBE_CODE,
+                model_id,
+                compute_type,
+                ",".join(_CUDA_COMPUTE_PREFERENCE),
             ],
             capture_output=True,
+            text=True,
             timeout=120,
             **_no_window_kwargs(),
         )
-        return r.returncode == 0
-    except Exception:
-        return False
+    except Exception as exc:
+        result["error"] = f"{type(exc).__name__}: {exc}"
+        return result
+    for line in (r.stdout or "").splitlines():
+        try:
+            data = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            result.update(data)
+    if result.get("load_ok") is not None:
+        result["load_ok"] = bool(result["load_ok"]) and r.returncode == 0
+    return result
+
+
+# Runs in a long-lived child: loads one model (cache first, so the ready
+# reply says whether it had to download), then answers one JSON line per job
+# read from stdin. A job is two length-prefixed frames: JSON decode options,
+# then the WAV bytes. argv carries only load-time options. Native crashes
+# still only take the child down.
+_WORKER_CODE = (
+    "import io, json, os, struct, sys, tempfile, wave\n"
+    "out = os.fdopen(os.dup(1), 'w', encoding='utf-8')\n"
+    "os.dup2(2, 1)\n"
+    "sys.stdout = sys.stderr\n"
+    "jobs = sys.stdin.buffer\n"
+    "kind, model_id, hw_device, compute_type, load_options = sys.argv[1:6]\n"
+    "load_options = json.loads(load_options)\n"
+    "downloaded = False\n"
+    "if kind == 'whisper':\n"
+    "    from faster_whisper import WhisperModel\n"
+    "    try:\n"
+    "        from faster_whisper import BatchedInferencePipeline\n"
+    "    except ImportError:\n"
+    "        BatchedInferencePipeline = None\n"
+    "    try:\n"
+    "        model = WhisperModel(model_id, device=hw_device, compute_type=compute_type, local_files_only=True)\n"
+    "    except Exception:\n"
+    "        downloaded = True\n"
+    "        model = WhisperModel(model_id, device=hw_device, compute_type=compute_type)\n"
+    "    batched = None\n"
+    "    if BatchedInferencePipeline is not None and hw_device == 'cuda':\n"
+    "        batched = BatchedInferencePipeline(model=model)\n"
+    "    def run(wav, decode):\n"
+    "        # Without VAD the batched pipeline has no clip timestamps for >30 s audio.\n"
+    "        if batched is not None and decode.get('vad_filter'):\n"
+    "            segments, _ = batched.transcribe(io.BytesIO(wav), batch_size=8, **decode)\n"
+    "        else:\n"
+    "            segments, _ = model.transcribe(io.BytesIO(wav), **decode)\n"
+    "        return ''.join(seg.text for seg in segments).strip()\n"
+    "else:\n"
+    "    import numpy as np\n"
+    "    import onnx_asr\n"
+    "    try:\n"
+    "        from huggingface_hub import constants as hf_constants\n"
+    "    except ImportError:\n"
+    "        hf_constants = None\n"
+    "    try:\n"
+    "        if hf_constants is not None:\n"
+    "            hf_constants.HF_HUB_OFFLINE = True\n"
+    "        model = onnx_asr.load_model(model_id, **load_options)\n"
+    "    except Exception:\n"
+    "        downloaded = True\n"
+    "        if hf_constants is not None:\n"
+    "            hf_constants.HF_HUB_OFFLINE = False\n"
+    "        model = onnx_asr.load_model(model_id, **load_options)\n"
+    "    def recognize(wav):\n"
+    "        try:\n"
+    "            with wave.open(io.BytesIO(wav)) as w:\n"
+    "                if w.getsampwidth() == 2:\n"
+    "                    channels, rate = w.getnchannels(), w.getframerate()\n"
+    "                    pcm = np.frombuffer(w.readframes(w.getnframes()), dtype='<i2')\n"
+    "                    if channels > 1:\n"
+    "                        pcm = pcm.reshape(-1, channels).mean(axis=1)\n"
+    "                    audio = pcm.astype(np.float32) / 32768.0\n"
+    "                    return model.recognize(audio, sample_rate=rate)\n"
+    "        except (wave.Error, EOFError):\n"
+    "            pass\n"
+    "        # Formats the wave module can't read go through a file instead.\n"
+    "        fd, path = tempfile.mkstemp(suffix='.wav')\n"
+    "        try:\n"
+    "            with os.fdopen(fd, 'wb') as f:\n"
+    "                f.write(wav)\n"
+    "            return model.recognize(path)\n"
+    "        finally:\n"
+    "            os.unlink(path)\n"
+    "    def run(wav, decode):\n"
+    "        result = recognize(wav)\n"
+    "        if isinstance(result, str):\n"
+    "            return result\n"
+    "        if isinstance(result, list) and result:\n"
+    "            return str(result[0])\n"
+    "        if isinstance(result, dict):\n"
+    "            if 'text' in result:\n"
+    "                return result['text']\n"
+    "            if 'segments' in result:\n"
+    "                return ' '.join(s.get('text', '') for s in result['segments'])\n"
+    "        return str(result)\n"
+    "if hw_device in ('cuda', 'gpu'):\n"
+    "    # One silent second primes cuDNN/cuBLAS selection and the GPU allocator.\n"
+    "    try:\n"
+    "        import numpy as np\n"
+    "        silence = np.zeros(16000, dtype=np.float32)\n"
+    "        if kind == 'whisper':\n"
+    "            list(model.transcribe(silence, beam_size=1, vad_filter=False)[0])\n"
+    "        else:\n"
+    "            model.recognize(silence)\n"
+    "    except Exception as exc:\n"
+    "        print(f'warmup failed: {exc}', file=sys.stderr)\n"
+    "out.write(json.dumps({'ready': True, 'downloaded': downloaded}) + '\\n')\n"
+    "out.flush()\n"
+    "def read_frame():\n"
+    "    head = jobs.read(4)\n"
+    "    if len(head) < 4:\n"
+    "        return None\n"
+    "    return jobs.read(struct.unpack('<I', head)[0])\n"
+    "while True:\n"
+    "    header = read_frame()\n"
+    "    wav = read_frame() if header is not None else None\n"
+    "    if wav is None:\n"
+    "        break\n"
+    "    try:\n"
+    "        reply = {'text': run(wav, json.loads(header))}\n"
+    "    except Exception as exc:\n"
+    "        reply = {'error': f'{type(exc).__name__}: {exc}'}\n"
+    "    out.write(json.dumps(reply) + '\\n')\n"
+    "    out.flush()\n"
+)
+
+
+class _InferenceWorker:
+    """One persistent child process holding a loaded model."""
+
+    def __init__(self, kind: str, model_id: str, hw_device: str, compute_type: str, load_options: str, env: dict):
+        self._proc = subprocess.Popen(
+            [sys.executable, "-c", _WORKER_CODE, kind, model_id, hw_device, compute_type, load_options],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            **_no_window_kwargs(),
+        )
+        self._replies: queue.SimpleQueue = queue.SimpleQueue()
+        self._stderr_tail: collections.deque[str] = collections.deque(maxlen=40)
+        threading.Thread(target=self._pump_stdout, daemon=True).start()
+        threading.Thread(target=self._pump_stderr, daemon=True).start()
+        self._model_id = model_id
+        self._ready = False
+        self._lock = threading.Lock()
+        self.busy = 0  # jobs in flight; only touched under the pool's lock
+
+    def _pump_stdout(self):
+        for line in self._proc.stdout:
+            self._replies.put(line.decode("utf-8", errors="replace"))
+        self._replies.put(None)
+
+    def _pump_stderr(self):
+        for line in self._proc.stderr:
+            self._stderr_tail.append(line.decode("utf-8", errors="replace"))
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def _read_reply(self, timeout: float) -> dict:
+        try:
+            line = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            self.stop()
+            raise RuntimeError(f"local inference worker timed out after {timeout:.0f}s")
+        if line is None:
+            code = self._proc.wait()
+            detail = "".join(self._stderr_tail).strip()
+            raise RuntimeError(detail or f"exit code {code}")
+        try:
+            reply = json.loads(line)
+        except ValueError:
+            reply = None
+        if not isinstance(reply, dict):
+            # Out of step with the child; it can't be trusted for later jobs.
+            self.stop()
+            raise RuntimeError(f"local inference worker sent a malformed reply: {line[:200]!r}")
+        return reply
+
+    def run(self, wav_bytes: bytes, decode_options: dict | None = None, timeout: float = 300) -> str:
+        with self._lock:
+            return self._run(wav_bytes, decode_options or {}, timeout)
+
+    def _run(self, wav_bytes: bytes, decode_options: dict, timeout: float) -> str:
+        if not self._ready:
+            # First reply is the load acknowledgement (includes any download).
+            if self._read_reply(timeout).get("downloaded"):
+                log.info("Local model %s was not cached; downloaded it.", self._model_id)
+            self._ready = True
+        header = json.dumps(decode_options).encode("utf-8")
+        try:
+            self._proc.stdin.write(struct.pack("<I", len(header)))
+            self._proc.stdin.write(header)
+            self._proc.stdin.write(struct.pack("<I", len(wav_bytes)))
+            self._proc.stdin.write(wav_bytes)
+            self._proc.stdin.flush()
+        except OSError:
+            pass  # the reader reports the exit with its stderr
+        reply = self._read_reply(timeout)
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        return str(reply.get("text", "")).rstrip("\r\n")
+
+    def stop(self):
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+
+
+class _WorkerPool:
+    """Workers shared by every engine, so engines on the same model reuse one process."""
+
+    def __init__(self, limit: int = 2):
+        self._limit = limit
+        self._workers: collections.OrderedDict[tuple, _InferenceWorker] = collections.OrderedDict()
+        # Engines (by id) that have used each key; a worker outlives an engine's
+        # unload() while another engine still holds it.
+        self._owners: dict[tuple, set[int]] = {}
+        # The key each engine last used; moving to a new key gives up the old one.
+        self._current: dict[int, tuple] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: tuple, spawn, owner: int) -> _InferenceWorker:
+        """Return a worker for `key`, marked busy until release() is called."""
+        doomed = []
+        with self._lock:
+            worker = self._workers.pop(key, None)
+            if worker is not None and not worker.alive():
+                # A job still on it stops it from release() instead.
+                if not worker.busy:
+                    doomed.append(worker)
+                worker = None
+            if worker is None:
+                worker = spawn()
+            self._workers[key] = worker
+            previous = self._current.get(owner)
+            if previous is not None and previous != key:
+                doomed.extend(self._drop_owner_locked(previous, owner))
+            self._current[owner] = key
+            self._owners.setdefault(key, set()).add(owner)
+            worker.busy += 1
+            doomed.extend(self._evict_locked())
+        for old in doomed:
+            old.stop()
+        return worker
+
+    def release(self, key: tuple, worker: _InferenceWorker) -> None:
+        doomed = []
+        with self._lock:
+            worker.busy -= 1
+            pooled = self._workers.get(key) is worker
+            if not worker.busy and (not pooled or not self._owners.get(key)):
+                # Evicted, discarded or unowned while it was running a job.
+                if pooled:
+                    del self._workers[key]
+                doomed.append(worker)
+            doomed.extend(self._evict_locked())
+        for old in doomed:
+            old.stop()
+
+    def _evict_locked(self) -> list[_InferenceWorker]:
+        # Each worker holds a whole model in RAM/VRAM; evict the least recent
+        # idle ones. Busy workers are skipped and reconsidered on release().
+        evicted = []
+        for key in list(self._workers):
+            if len(self._workers) <= self._limit:
+                break
+            worker = self._workers[key]
+            if not worker.busy:
+                del self._workers[key]
+                evicted.append(worker)
+        return evicted
+
+    def discard(self, key: tuple, worker: _InferenceWorker) -> None:
+        with self._lock:
+            if self._workers.get(key) is worker:
+                del self._workers[key]
+            busy = worker.busy
+        if not busy:
+            worker.stop()
+
+    def _drop_owner_locked(self, key: tuple, owner: int) -> list[_InferenceWorker]:
+        # Stop the worker once nobody holds it; a busy one is stopped by release().
+        owners = self._owners.get(key)
+        if owners is None:
+            return []
+        owners.discard(owner)
+        if owners:
+            return []
+        del self._owners[key]
+        worker = self._workers.get(key)
+        if worker is None or worker.busy:
+            return []
+        del self._workers[key]
+        return [worker]
+
+    def release_owner(self, owner: int) -> None:
+        """Forget `owner`; stop idle workers nobody else holds."""
+        with self._lock:
+            key = self._current.pop(owner, None)
+            doomed = self._drop_owner_locked(key, owner) if key is not None else []
+        for worker in doomed:
+            worker.stop()
+
+
+_worker_pool = _WorkerPool()
 
 
 class LocalInferenceEngine:
@@ -127,7 +516,8 @@ class LocalInferenceEngine:
         self._loaded_device = None
         self._warmed_models: set[tuple[str, str, str]] = set()
         self._ready_tokens: set[str] = self._load_ready_tokens()
-        self._probe_cache: dict[str, bool] = {}
+        self._runtime_probes: dict = self._load_runtime_probes()
+        self._failed_probes: dict[str, tuple[float, dict]] = {}
 
     def transcribe(self, wav_bytes: bytes) -> str:
         model_name = self._settings.get("model", "")
@@ -141,26 +531,9 @@ class LocalInferenceEngine:
         self._loaded_name = None
         self._loaded_device = None
         self._warmed_models.clear()
-        self._probe_cache.clear()
-
-    def is_warm(self, model_name: str, device: str) -> bool:
-        if is_parakeet_model(model_name):
-            token = self._model_token("parakeet", model_name)
-            if self._is_ready_token(token):
-                return True
-            ok = self._probe_local_cache("parakeet", model_name)
-            if ok:
-                self._mark_ready("parakeet", model_name)
-            return ok
-        if is_whisper_model(model_name):
-            token = self._model_token("whisper", model_name)
-            if self._is_ready_token(token):
-                return True
-            ok = self._probe_local_cache("whisper", model_name)
-            if ok:
-                self._mark_ready("whisper", model_name)
-            return ok
-        return True
+        self._runtime_probes = self._load_runtime_probes()
+        self._failed_probes.clear()
+        _worker_pool.release_owner(id(self))
 
     def is_ready_cached(self, model_name: str) -> bool:
         if is_parakeet_model(model_name):
@@ -178,7 +551,7 @@ class LocalInferenceEngine:
         self._configure_cache()
         fw_id = FASTER_WHISPER_IDS[model_name]
         hw_device, compute_type = self._resolve_whisper_runtime(fw_id, device)
-        cold_start = not self.is_warm(model_name, device)
+        cold_start = not self.is_ready_cached(model_name)
         if cold_start:
             log.info("Whisper warmup/download start: model=%s device=%s", model_name, hw_device)
 
@@ -191,7 +564,7 @@ class LocalInferenceEngine:
         except RuntimeError as exc:
             if hw_device == "cuda":
                 log.warning("Whisper CUDA subprocess failed (%s); retrying on CPU.", exc)
-                text = self._infer_whisper_subprocess(wav_bytes, fw_id, "cpu", "int8")
+                text = self._infer_whisper_subprocess(wav_bytes, fw_id, "cpu", "auto")
                 self._warmed_models.add(("whisper", model_name, device))
                 self._mark_ready("whisper", model_name)
                 return text
@@ -202,15 +575,25 @@ class LocalInferenceEngine:
                 log.info("Whisper warmup/download finished in %.1fs", elapsed)
 
     def _resolve_whisper_runtime(self, fw_id: str, device: str) -> tuple[str, str]:
-        use_cuda = device == "gpu" and _ctranslate2_cuda_ok()
-        if use_cuda and not _whisper_cuda_load_ok(fw_id, "float16"):
-            use_cuda = False
+        # "auto" resolves from the probed CUDA types (INT8 is not allowed on
+        # every GPU); on CPU CTranslate2 picks itself. The setting can pin a type.
+        compute_type = str(self._settings.get("whisper_compute_type", "auto") or "auto").strip().lower()
+        use_cuda = False
+        if device == "gpu" and _cuda_available():
+            probe = self._runtime_probe("whisper_cuda", _whisper_cuda_probe, fw_id, compute_type)
+            load_ok = probe.get("load_ok")
+            # Not downloaded yet: trust the compute types and let the worker try
+            # CUDA; a failed load there still falls back to CPU.
+            use_cuda = load_ok is True or (load_ok is None and bool(probe.get("compute_types")))
+            if use_cuda:
+                compute_type = str(probe.get("compute_type") or compute_type)
         if device == "gpu" and not use_cuda:
             log.warning(
                 "GPU mode requested, but CUDA probe failed; falling back to CPU "
                 "for faster-whisper to avoid a native crash."
             )
-        return ("cuda", "float16") if use_cuda else ("cpu", "int8")
+            compute_type = "auto"
+        return ("cuda" if use_cuda else "cpu"), compute_type
 
     def _infer_whisper_subprocess(
         self,
@@ -219,36 +602,19 @@ class LocalInferenceEngine:
         hw_device: str,
         compute_type: str,
     ) -> str:
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(wav_bytes)
-            tmp_path = f.name
+        # Greedy decoding without prompt carry-over: push-to-talk clips are short,
+        # and Silero VAD skips the silence around them.
         try:
-            code = (
-                "import sys\n"
-                "from faster_whisper import WhisperModel\n"
-                "wav_path, model_id, hw_device, compute_type = sys.argv[1:5]\n"
-                "model = WhisperModel(model_id, device=hw_device, compute_type=compute_type)\n"
-                "segments, _ = model.transcribe(wav_path)\n"
-                "print(''.join(seg.text for seg in segments).strip())\n"
-            )
-            result = subprocess.run(
-                [sys.executable, "-c", code, tmp_path, model_id, hw_device, compute_type],
-                capture_output=True,
-                text=True,
-                timeout=300,
-                **_no_window_kwargs(),
-            )
-            if result.returncode != 0:
-                err = (result.stderr or "").strip()
-                out = (result.stdout or "").strip()
-                detail = err or out or f"exit code {result.returncode}"
-                raise RuntimeError(detail)
-            return (result.stdout or "").rstrip("\r\n")
-        finally:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
+            beam_size = int(self._settings.get("whisper_beam_size", 1))
+        except (TypeError, ValueError):
+            beam_size = 1
+        options = {
+            "vad_filter": bool(self._settings.get("whisper_vad_filter", True)),
+            "beam_size": max(1, min(beam_size, 10)),
+            "condition_on_previous_text": False,
+            "temperature": 0.0,
+        }
+        return self._run_worker(wav_bytes, "whisper", model_id, hw_device, compute_type, {}, {}, options)
 
     # Parakeet (onnx-asr)
     def _transcribe_parakeet(self, wav_bytes: bytes, model_name: str, device: str) -> str:
@@ -259,20 +625,20 @@ class LocalInferenceEngine:
         self._configure_cache()
         onnx_id = ONNX_MODEL_IDS[model_name]
         run_device = self._resolve_parakeet_runtime(device)
-        cold_start = not self.is_warm(model_name, device)
+        cold_start = not self.is_ready_cached(model_name)
         if cold_start:
             log.info("Parakeet warmup/download start: model=%s device=%s", model_name, run_device)
 
         started = time.perf_counter()
         try:
-            text = self._infer_parakeet_subprocess(wav_bytes, onnx_id, run_device)
+            text = self._infer_parakeet_subprocess(wav_bytes, onnx_id, run_device, model_name)
             self._warmed_models.add(("parakeet", model_name, device))
             self._mark_ready("parakeet", model_name)
             return text
         except RuntimeError as exc:
             if run_device == "gpu":
                 log.warning("Parakeet GPU subprocess failed (%s); retrying on CPU.", exc)
-                text = self._infer_parakeet_subprocess(wav_bytes, onnx_id, "cpu")
+                text = self._infer_parakeet_subprocess(wav_bytes, onnx_id, "cpu", model_name)
                 self._warmed_models.add(("parakeet", model_name, device))
                 self._mark_ready("parakeet", model_name)
                 return text
@@ -291,56 +657,59 @@ class LocalInferenceEngine:
             )
         return "gpu" if use_cuda else "cpu"
 
-    def _infer_parakeet_subprocess(self, wav_bytes: bytes, onnx_id: str, run_device: str) -> str:
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(wav_bytes)
-            tmp_path = f.name
+    def _infer_parakeet_subprocess(
+        self,
+        wav_bytes: bytes,
+        onnx_id: str,
+        run_device: str,
+        model_name: str = "",
+    ) -> str:
+        env = {"CUDA_VISIBLE_DEVICES": "-1" if run_device == "cpu" else None}
+        load_options = {}
+        quantization = ONNX_MODEL_QUANTIZATION.get(model_name)
+        if quantization:
+            load_options["quantization"] = quantization
+        return self._run_worker(wav_bytes, "parakeet", onnx_id, run_device, "", env, load_options)
+
+    # Persistent worker
+    def _run_worker(
+        self,
+        wav_bytes: bytes,
+        kind: str,
+        model_id: str,
+        hw_device: str,
+        compute_type: str,
+        env: dict,
+        load_options: dict,
+        decode_options: dict | None = None,
+    ) -> str:
+        # `env` holds overrides (None removes a variable); the full environment
+        # is only copied when a worker has to be started. Only load-time
+        # arguments pick the worker; decode options travel with each job.
+        options_json = json.dumps(load_options, sort_keys=True)
+        key = (
+            kind, model_id, hw_device, compute_type, options_json,
+            tuple(sorted(env.items())), os.environ.get("HF_HOME"),
+        )
+
+        def spawn() -> _InferenceWorker:
+            worker_env = os.environ.copy()
+            for name, value in env.items():
+                if value is None:
+                    worker_env.pop(name, None)
+                else:
+                    worker_env[name] = value
+            return _InferenceWorker(kind, model_id, hw_device, compute_type or "default", options_json, worker_env)
+
+        worker = _worker_pool.acquire(key, spawn, id(self))
         try:
-            code = (
-                "import sys\n"
-                "import onnx_asr\n"
-                "wav_path, model_id = sys.argv[1:3]\n"
-                "model = onnx_asr.load_model(model_id)\n"
-                "result = model.recognize(wav_path)\n"
-                "if isinstance(result, str):\n"
-                "    text = result\n"
-                "elif isinstance(result, list) and result:\n"
-                "    text = str(result[0])\n"
-                "elif isinstance(result, dict):\n"
-                "    if 'text' in result:\n"
-                "        text = result['text']\n"
-                "    elif 'segments' in result:\n"
-                "        text = ' '.join(s.get('text', '') for s in result['segments'])\n"
-                "    else:\n"
-                "        text = str(result)\n"
-                "else:\n"
-                "    text = str(result)\n"
-                "print(text)\n"
-            )
-            env = os.environ.copy()
-            if run_device == "cpu":
-                env["CUDA_VISIBLE_DEVICES"] = "-1"
-            else:
-                env.pop("CUDA_VISIBLE_DEVICES", None)
-            result = subprocess.run(
-                [sys.executable, "-c", code, tmp_path, onnx_id],
-                capture_output=True,
-                text=True,
-                timeout=300,
-                env=env,
-                **_no_window_kwargs(),
-            )
-            if result.returncode != 0:
-                err = (result.stderr or "").strip()
-                out = (result.stdout or "").strip()
-                detail = err or out or f"exit code {result.returncode}"
-                raise RuntimeError(detail)
-            return (result.stdout or "").rstrip("\r\n")
+            return worker.run(wav_bytes, decode_options)
+        except RuntimeError:
+            if not worker.alive():
+                _worker_pool.discard(key, worker)
+            raise
         finally:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
+            _worker_pool.release(key, worker)
 
     def _configure_cache(self):
         if self._settings.get("portable_models", False):
@@ -385,69 +754,64 @@ class LocalInferenceEngine:
     def _persist_ready_tokens(self) -> None:
         if not hasattr(self._settings, "update"):
             return
+        # Other engines write the same setting; merge so neither drops the
+        # other's tokens, and skip the settings write when nothing is new.
+        stored = self._load_ready_tokens()
+        if self._ready_tokens <= stored:
+            self._ready_tokens = stored
+            return
+        self._ready_tokens |= stored
         try:
             payload = json.dumps(sorted(self._ready_tokens))
             self._settings.update({"local_ready_models": payload})
         except Exception:
             pass
 
-    def _probe_local_cache(self, kind: str, model_name: str) -> bool:
-        token = self._model_token(kind, model_name)
-        if token in self._probe_cache:
-            return self._probe_cache[token]
-
-        if kind == "whisper":
-            fw_id = FASTER_WHISPER_IDS.get(model_name)
-            if not fw_id:
-                self._probe_cache[token] = False
-                return False
-            code = (
-                "import os,sys\n"
-                "from faster_whisper import WhisperModel\n"
-                "model_id = sys.argv[1]\n"
-                "root = os.environ.get('HF_HOME') or None\n"
-                "WhisperModel(model_id, device='cpu', compute_type='int8', local_files_only=True, download_root=root)\n"
-                "print('ok')\n"
-            )
-            env = os.environ.copy()
-            result = subprocess.run(
-                [sys.executable, "-c", code, fw_id],
-                capture_output=True,
-                text=True,
-                timeout=25,
-                env=env,
-                **_no_window_kwargs(),
-            )
-            ok = result.returncode == 0
-            self._probe_cache[token] = ok
-            return ok
-
-        if kind == "parakeet":
-            onnx_id = ONNX_MODEL_IDS.get(model_name)
-            if not onnx_id:
-                self._probe_cache[token] = False
-                return False
-            code = (
-                "import sys\n"
-                "import onnx_asr\n"
-                "model_id = sys.argv[1]\n"
-                "onnx_asr.load_model(model_id)\n"
-                "print('ok')\n"
-            )
-            env = os.environ.copy()
-            env["HF_HUB_OFFLINE"] = "1"
-            env["TRANSFORMERS_OFFLINE"] = "1"
-            result = subprocess.run(
-                [sys.executable, "-c", code, onnx_id],
-                capture_output=True,
-                text=True,
-                timeout=25,
-                env=env,
-                **_no_window_kwargs(),
-            )
-            ok = result.returncode == 0
-            self._probe_cache[token] = ok
-            return ok
-
-        self._probe_cache[token] = False
-        return False
+    # Successful CUDA probes survive restarts until the driver, interpreter or
+    # CTranslate2 version changes. Failures are only remembered in memory for
+    # a few minutes, and "unknown" results (model not downloaded) not at all,
+    # so a one-off timeout or crash can't disable CUDA for good.
+    def _runtime_probe(self, name: str, probe, *args: str) -> dict:
+        key = "|".join((name,) + args)
+        cached = self._runtime_probes.get(key)
+        if cached is not None:
+            return cached
+        failed = self._failed_probes.get(key)
+        if failed is not None and time.monotonic() - failed[0] < _FAILED_PROBE_TTL_S:
+            return failed[1]
+        result = probe(*args)
+        load_ok = result.get("load_ok")
+        if load_ok is True and "error" not in result:
+            self._runtime_probes[key] = result
+            self._failed_probes.pop(key, None)
+            self._persist_runtime_probes()
+        elif load_ok is False:
+            self._failed_probes[key] = (time.monotonic(), result)
+        return result
+
+    def _load_runtime_probes(self) -> dict:
+        raw = self._settings.get("runtime_probe_cache", "")
+        if not raw:
+            return {}
+        try:
+            data = json.loads(str(raw))
+        except Exception:
+            return {}
+        if not isinstance(data, dict) or data.get("fingerprint") != _runtime_fingerprint():
+            return {}
+        results = data.get("results")
+        if not isinstance(results, dict):
+            return {}
+        return {
+            str(k): v for k, v in results.items()
+            if isinstance(v, dict) and v.get("load_ok") is True
+        }
+
+    def _persist_runtime_probes(self) -> None:
+        if not hasattr(self._settings, "update"):
+            return
+        try:
+            payload = json.dumps({"fingerprint": _runtime_fingerprint(), "results": self._runtime_probes})
+            self._settings.update({"runtime_probe_cache": payload})
+        except Exception:
+            pass
@@ -1,8 +1,32 @@
+import math
+import time
+
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from theme import normalize_theme, theme_colors
 from toast import anchored_position, normalize_anchor
 
+# Level updates closer together than this are folded into the next one.
+_RMS_INTERVAL_NS = 30_000_000
+
+
+def _rms_scale(rms: float) -> float:
+    # Map RMS roughly to dBFS and normalize into [0.5, 2.0].
+    # int16 full scale is 32768; clamp floor to avoid log(0).
+    dbfs = 20.0 * math.log10(max(rms, 1.0) / 32768.0)
+    normalized = (dbfs + 65.0) / 53.0  # about -65dBFS..-12dBFS
+    normalized = max(0.0, min(1.0, normalized))
+    return 0.5 + (normalized * 1.5)
+
+
+# _rms_scale() sampled at the centre of 8-wide RMS buckets; the last bucket
+# is past -12 dBFS, where the scale is already at its maximum.
+_RMS_BUCKET_SHIFT = 3
+_RMS_TO_SCALE = tuple(
+    _rms_scale((i << _RMS_BUCKET_SHIFT) + 4) for i in range((8230 >> _RMS_BUCKET_SHIFT) + 2)
+)
+_RMS_LAST_BUCKET = len(_RMS_TO_SCALE) - 1
+
 class _OverlayDot(QtWidgets.QWidget):
     def __init__(self, theme: str):
         super().__init__()
@@ -17,33 +41,44 @@ class _OverlayDot(QtWidgets.QWidget):
         self.setFixedSize(46, 46)
         self._bright = True
         self._scale = 0.5
+        # Paint objects are rebuilt on theme change, not per frame.
+        self._pen = QtGui.QPen(QtGui.QColor("#000000"), 2)
+        self._dim_brush = QtGui.QBrush(QtGui.QColor("#24262b"))
+        self._bright_brush = self._record_brush()
+
+    def _record_brush(self) -> QtGui.QBrush:
+        return QtGui.QBrush(QtGui.QColor(theme_colors(self._theme)["tray_record"]))
 
     def toggle_state(self) -> None:
         self._bright = not self._bright
         self.update()
 
     def set_theme(self, theme: str):
-        self._theme = normalize_theme(theme)
+        theme = normalize_theme(theme)
+        if theme == self._theme:
+            return
+        self._theme = theme
+        self._bright_brush = self._record_brush()
         self.update()
 
     def set_scale(self, scale: float):
         target = max(0.5, min(2.0, float(scale)))
         # Smooth motion to avoid jitter from chunk-to-chunk level changes.
+        before = self._diameter()
         self._scale = (self._scale * 0.88) + (target * 0.12)
-        self.update()
+        if self._diameter() != before:
+            self.update()  # sub-pixel changes would paint the same ellipse
+
+    def _diameter(self) -> int:
+        diameter = int(round(self._base_diameter * self._scale))
+        return max(int(round(self._base_diameter * 0.5)), min(self._base_diameter * 2, diameter))
 
     def paintEvent(self, _event):
-        colors = theme_colors(self._theme)
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
-        if self._bright:
-            color = QtGui.QColor(colors["tray_record"])
-        else:
-            color = QtGui.QColor("#24262b")
-        painter.setBrush(color)
-        painter.setPen(QtGui.QPen(QtGui.QColor("#000000"), 2))
-        diameter = int(round(self._base_diameter * self._scale))
-        diameter = max(int(round(self._base_diameter * 0.5)), min(self._base_diameter * 2, diameter))
+        painter.setBrush(self._bright_brush if self._bright else self._dim_brush)
+        painter.setPen(self._pen)
+        diameter = self._diameter()
         x = (self.width() - diameter) // 2
         y = (self.height() - diameter) // 2
         painter.drawEllipse(x, y, diameter, diameter)
@@ -59,15 +94,33 @@ class RecordingOverlay:
         self._preview_phase = 0.0
         self._preview_active = False
         self._preview_anchor: str | None = None
+        self._rms_last_ns = 0
+        self._rms_peak = 0.0
+        self._shown = False
 
     def show(self):
+        self._shown = True
         self._ui.call_soon(self._show_ui)
 
     def hide(self):
+        self._shown = False
         self._ui.call_soon(self._hide_ui)
 
+    def needs_rms(self) -> bool:
+        """Whether level updates are wanted; lets producers skip computing RMS."""
+        return self._shown
+
     def set_rms(self, rms_value: float):
-        self._ui.call_soon(lambda: self._set_rms_ui(rms_value))
+        # Audio callbacks fire faster than the dot can visibly change; only
+        # hop to the UI thread every ~30 ms, carrying the peak in between.
+        peak = max(self._rms_peak, rms_value)
+        now = time.monotonic_ns()
+        if now - self._rms_last_ns < _RMS_INTERVAL_NS:
+            self._rms_peak = peak
+            return
+        self._rms_last_ns = now
+        self._rms_peak = 0.0
+        self._ui.call_soon(lambda: self._set_rms_ui(peak))
 
     def preview_pulse(self, duration_ms: int = 1000, anchor: str | None = None):
         self._ui.call_soon(lambda: self._start_preview_ui(duration_ms, anchor))
@@ -119,6 +172,7 @@ class RecordingOverlay:
 
         if self._timer is None:
             self._timer = QtCore.QTimer()
+            self._timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
             self._timer.timeout.connect(self._dot.toggle_state)
         self._timer.start(500)
 
@@ -141,14 +195,7 @@ class RecordingOverlay:
             rms = max(0.0, float(rms_value))
         except (TypeError, ValueError):
             return
-        # Map RMS roughly to dBFS and normalize into [0.5, 2.0].
-        # int16 full scale is 32768; clamp floor to avoid log(0).
-        import math
-        dbfs = 20.0 * math.log10(max(rms, 1.0) / 32768.0)
-        normalized = (dbfs + 65.0) / 53.0  # about -65dBFS..-12dBFS
-        normalized = max(0.0, min(1.0, normalized))
-        scale = 0.5 + (normalized * 1.5)
-        self._dot.set_scale(scale)
+        self._dot.set_scale(_RMS_TO_SCALE[min(int(rms) >> _RMS_BUCKET_SHIFT, _RMS_LAST_BUCKET)])
 
     def _start_preview_ui(self, duration_ms: int, anchor: str | None = None):
         self._preview_anchor = normalize_anchor(anchor) if anchor else None
@@ -157,6 +204,7 @@ class RecordingOverlay:
         self._preview_phase = 0.0
         if self._preview_timer is None:
             self._preview_timer = QtCore.QTimer()
+            self._preview_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
             self._preview_timer.timeout.connect(self._tick_preview)
         self._preview_timer.start(33)
         stop_ms = max(250, int(duration_ms))
@@ -165,7 +213,6 @@ class RecordingOverlay:
     def _tick_preview(self):
         if self._dot is None or not self._dot.isVisible():
             return
-        import math
         self._preview_phase += 0.22
         s = 0.5 + ((math.sin(self._preview_phase) + 1.0) * 0.5) * 1.5
         self._dot.set_scale(s)
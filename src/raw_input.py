@@ -0,0 +1,141 @@
+import ctypes
+import sys
+from ctypes import wintypes
+
+from logger import log
+
+WM_INPUT = 0x00FF
+_RID_INPUT = 0x10000003
+_RIM_TYPEKEYBOARD = 1
+_RIDEV_REMOVE = 0x00000001
+_RIDEV_INPUTSINK = 0x00000100
+_RI_KEY_BREAK = 0x0001
+
+
+class _RAWINPUTDEVICE(ctypes.Structure):
+    _fields_ = [
+        ("usUsagePage", wintypes.USHORT),
+        ("usUsage", wintypes.USHORT),
+        ("dwFlags", wintypes.DWORD),
+        ("hwndTarget", wintypes.HWND),
+    ]
+
+
+class _RAWINPUTHEADER(ctypes.Structure):
+    _fields_ = [
+        ("dwType", wintypes.DWORD),
+        ("dwSize", wintypes.DWORD),
+        ("hDevice", wintypes.HANDLE),
+        ("wParam", wintypes.WPARAM),
+    ]
+
+
+class _RAWKEYBOARD(ctypes.Structure):
+    _fields_ = [
+        ("MakeCode", wintypes.USHORT),
+        ("Flags", wintypes.USHORT),
+        ("Reserved", wintypes.USHORT),
+        ("VKey", wintypes.USHORT),
+        ("Message", wintypes.UINT),
+        ("ExtraInformation", wintypes.ULONG),
+    ]
+
+
+class _RAWINPUT(ctypes.Structure):
+    _fields_ = [("header", _RAWINPUTHEADER), ("keyboard", _RAWKEYBOARD)]
+
+
+# Virtual-key codes -> the key names the hotkey picker uses.
+_VK_NAMES = {
+    0x10: "shift", 0xA0: "shift", 0xA1: "shift",
+    0x11: "ctrl", 0xA2: "ctrl", 0xA3: "ctrl",
+    0x12: "alt", 0xA4: "alt", 0xA5: "alt",
+    0x5B: "windows", 0x5C: "windows",
+    0x20: "space",
+    0x0D: "enter",
+    0x09: "tab",
+    0x1B: "esc",
+    0x08: "backspace",
+    0x2E: "delete",
+    0x2D: "insert",
+    0x24: "home",
+    0x23: "end",
+    0x21: "page up",
+    0x22: "page down",
+    0x26: "up",
+    0x28: "down",
+    0x25: "left",
+    0x27: "right",
+    0x6A: "num *",
+    0x6B: "num +",
+    0x6D: "num -",
+    0x6E: "num .",
+    0x6F: "num /",
+}
+_VK_NAMES.update({vk: chr(vk).lower() for vk in range(0x41, 0x5B)})
+_VK_NAMES.update({vk: chr(vk) for vk in range(0x30, 0x3A)})
+_VK_NAMES.update({0x60 + n: f"num {n}" for n in range(10)})
+_VK_NAMES.update({0x70 + n: f"f{n + 1}" for n in range(12)})
+
+_user32 = None
+
+
+def _api():
+    # Private WinDLL so argtypes set here don't leak into ctypes.windll.
+    global _user32
+    if _user32 is None:
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        user32.RegisterRawInputDevices.argtypes = [
+            ctypes.POINTER(_RAWINPUTDEVICE), wintypes.UINT, wintypes.UINT,
+        ]
+        user32.RegisterRawInputDevices.restype = wintypes.BOOL
+        user32.GetRawInputData.argtypes = [
+            wintypes.HANDLE, wintypes.UINT, ctypes.c_void_p,
+            ctypes.POINTER(wintypes.UINT), wintypes.UINT,
+        ]
+        user32.GetRawInputData.restype = wintypes.UINT
+        _user32 = user32
+    return _user32
+
+
+def _register(flags: int, hwnd) -> bool:
+    device = _RAWINPUTDEVICE(0x01, 0x06, flags, hwnd)  # generic desktop / keyboard
+    return bool(_api().RegisterRawInputDevices(ctypes.byref(device), 1, ctypes.sizeof(device)))
+
+
+def register_keyboard_sink(hwnd: int) -> bool:
+    """Deliver keyboard WM_INPUT to `hwnd`, even when it is not focused."""
+    if sys.platform != "win32":
+        return False
+    try:
+        return _register(_RIDEV_INPUTSINK, hwnd)
+    except Exception as exc:
+        log.debug("Raw input registration failed: %s", exc)
+        return False
+
+
+def unregister_keyboard_sink() -> None:
+    if sys.platform != "win32":
+        return
+    try:
+        _register(_RIDEV_REMOVE, None)
+    except Exception as exc:
+        log.debug("Raw input removal failed: %s", exc)
+
+
+def read_key_event(message_ptr: int) -> tuple[str, bool] | None:
+    """Decode a native MSG pointer; returns (key name, pressed) for keyboard WM_INPUT."""
+    msg = wintypes.MSG.from_address(message_ptr)
+    if msg.message != WM_INPUT:
+        return None
+    raw = _RAWINPUT()
+    size = wintypes.UINT(ctypes.sizeof(raw))
+    got = _api().GetRawInputData(
+        msg.lParam, _RID_INPUT, ctypes.byref(raw), ctypes.byref(size), ctypes.sizeof(_RAWINPUTHEADER),
+    )
+    if got == 0xFFFFFFFF or raw.header.dwType != _RIM_TYPEKEYBOARD:
+        return None
+    name = _VK_NAMES.get(raw.keyboard.VKey)
+    if name is None:
+        return None
+    return name, not (raw.keyboard.Flags & _RI_KEY_BREAK)
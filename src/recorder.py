@@ -1,18 +1,59 @@
-import io
+import ctypes
+import os
+import struct
+import sys
 import threading
-import wave
 
-import numpy as np
 import sounddevice as sd
 
+from audio_kernels import sum_squares_int16
 from logger import log
 
+_WAV_HEADER_SIZE = 44
+
+
+def _wav_header(data_size: int, sample_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+    """Canonical 44-byte PCM WAV header for `data_size` bytes of samples."""
+    block_align = channels * sample_width
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, sample_width * 8,
+        b"data", data_size,
+    )
+
+
+def _raise_thread_priority():
+    """Raise the calling thread's scheduling priority; best effort."""
+    try:
+        if sys.platform == "win32":
+            THREAD_PRIORITY_TIME_CRITICAL = 15
+            kernel32 = ctypes.windll.kernel32
+            if not kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_TIME_CRITICAL):
+                log.warning("SetThreadPriority failed for capture thread")
+                return
+        elif hasattr(os, "sched_setscheduler"):
+            # pid 0 targets the calling thread on Linux; needs CAP_SYS_NICE.
+            priority = os.sched_get_priority_min(os.SCHED_FIFO)
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        else:
+            return
+        log.debug("Capture thread priority raised")
+    except Exception as exc:
+        log.warning("Could not raise capture thread priority: %s", exc)
+
 
 class AudioRecorder:
     def __init__(self, settings_manager):
         self._settings = settings_manager
         self._recording = False
-        self._frames = []
+        # WAV bytes are assembled while recording; the first 44 bytes are
+        # reserved for the header, which is patched in on stop().
+        self._pcm = bytearray(_WAV_HEADER_SIZE)
+        self._block_count = 0
+        self._sample_count = 0
+        self._sum_squares = 0
+        self._sample_rate = 16000
         self._stream = None
         self._lock = threading.Lock()
         self._last_capture_info = {
@@ -50,7 +91,11 @@ class AudioRecorder:
             sample_rate,
         )
 
-        self._frames = []
+        self._pcm = bytearray(_WAV_HEADER_SIZE)
+        self._block_count = 0
+        self._sample_count = 0
+        self._sum_squares = 0
+        self._sample_rate = int(sample_rate)
         self._recording = True
         self._last_capture_info = {
             "rms": None,
@@ -59,16 +104,27 @@ class AudioRecorder:
             "rejected_by_threshold": False,
         }
 
+        # The PortAudio callback thread is created by the stream, so the
+        # priority can only be raised from inside the first callback.
+        boost_priority = [bool(self._settings.get("capture_high_priority", False))]
+
         def _callback(indata, frames, time_info, status):
+            if boost_priority[0]:
+                boost_priority[0] = False
+                _raise_thread_priority()
             if status:
                 log.warning("sounddevice status: %s", status)
             if self._recording:
+                samples = indata.reshape(-1)
+                block_ssq = sum_squares_int16(samples)
                 with self._lock:
-                    self._frames.append(indata.copy())
-                if callable(level_callback):
+                    self._pcm += memoryview(indata).cast("B")
+                    self._block_count += 1
+                    self._sample_count += samples.size
+                    self._sum_squares += block_ssq
+                if callable(level_callback) and samples.size:
                     try:
-                        rms = float(np.sqrt(np.mean(np.square(indata.astype(np.float32)))))
-                        level_callback(rms)
+                        level_callback((block_ssq / samples.size) ** 0.5)
                     except Exception:
                         pass
 
@@ -100,15 +156,18 @@ class AudioRecorder:
             self._stream = None
 
         with self._lock:
-            frame_count = len(self._frames)
-            if not self._frames:
-                log.warning("Recording stopped but no audio frames captured")
-                return None
-            audio = np.concatenate(self._frames, axis=0)
+            frame_count = self._block_count
+            sample_count = self._sample_count
+            sum_squares = self._sum_squares
+            pcm = self._pcm
+            self._pcm = bytearray(_WAV_HEADER_SIZE)
+        if sample_count <= 0:
+            log.warning("Recording stopped but no audio frames captured")
+            return None
 
-        sample_rate = self._settings.get("sample_rate", 16000)
-        duration = len(audio) / sample_rate
-        rms = float(np.sqrt(np.mean(np.square(audio.astype(np.float32)))))
+        sample_rate = self._sample_rate
+        duration = sample_count / sample_rate
+        rms = (sum_squares / sample_count) ** 0.5
         threshold = self._get_sensitivity()
         sensitivity_enabled = threshold > 0
 
@@ -126,21 +185,11 @@ class AudioRecorder:
             log.info("Recording rejected by sensitivity threshold")
             return None
 
-        wav_bytes = self._to_wav(audio)
+        pcm[:_WAV_HEADER_SIZE] = _wav_header(len(pcm) - _WAV_HEADER_SIZE, sample_rate)
+        wav_bytes = bytes(pcm)
         log.debug("WAV buffer size: %d bytes", len(wav_bytes))
         return wav_bytes
 
-    def _to_wav(self, audio: np.ndarray) -> bytes:
-        sample_rate = self._settings.get("sample_rate", 16000)
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(audio.tobytes())
-        buf.seek(0)
-        return buf.read()
-
     def _get_sensitivity(self) -> int:
         try:
             threshold = int(self._settings.get("microphone_sensitivity", 80))
@@ -10,6 +10,7 @@ DEFAULT_SETTINGS = {
     "api_endpoint": "/v1/audio/transcriptions",
     "model": "whisper-tiny",
     "language": "auto",
+    "api_response_format": "text",  # "text" | "json"
     # Hotkey
     "hotkey": "ctrl+shift+space",
     "system_audio_hotkey": "",
@@ -39,13 +40,18 @@ DEFAULT_SETTINGS = {
     "microphone_sensitivity_enabled": False,  # legacy key, kept for compatibility
     "microphone_sensitivity": 80,   # 0 disables sensitivity gating; otherwise minimum RMS
     "sample_rate": 16000,
+    "capture_high_priority": False, # raise the audio callback thread to time-critical priority
     # Local inference
     "model_device": "gpu",          # "cpu" | "gpu"
+    "whisper_compute_type": "auto", # CTranslate2 compute_type; "auto" picks the fastest the device supports
+    "whisper_vad_filter": True,     # skip silence with faster-whisper's Silero VAD
+    "whisper_beam_size": 1,         # 1 = greedy decoding
     "portable_models": False,       # store models in ./models/ instead of HF cache
     "output_capture_source": "auto",
     "test_input_file": "",
     "whisper_backend": "local",     # "local" (faster-whisper) | "api" (external server)
     "local_ready_models": "",       # JSON list of known-ready local model cache tokens
+    "runtime_probe_cache": "",      # JSON {"fingerprint", "results"} of CUDA probe outcomes
     "speed_stats_mode": "current",  # "disabled" | "current" | "average"
 }
 
@@ -96,9 +102,17 @@ def _coerce(key: str, raw: str):
     return raw
 
 
+# Millisecond keys from older configs -> the seconds keys that replaced them.
+_LEGACY_MS_KEYS = {
+    "notification_duration_ms": "notification_duration_s",
+    "notification_fade_duration_ms": "notification_fade_duration_s",
+}
+
+
 class SettingsManager:
     def __init__(self):
         self._settings = DEFAULT_SETTINGS.copy()
+        self._clamped: dict = {}
         self._load()
 
     def _load(self):
@@ -106,10 +120,20 @@ class SettingsManager:
             config = configparser.RawConfigParser()
             config.read(CONFIG_FILE, encoding="utf-8")
             if config.has_section(SECTION):
+                legacy = False
                 for key, raw in config.items(SECTION):
                     if key in DEFAULT_SETTINGS:
                         self._settings[key] = _coerce(key, raw)
+                    elif key in _LEGACY_MS_KEYS and not config.has_option(SECTION, _LEGACY_MS_KEYS[key]):
+                        # Only loaded keys survive, so convert before the value is lost.
+                        try:
+                            self._settings[_LEGACY_MS_KEYS[key]] = float(raw) / 1000.0
+                            legacy = True
+                        except ValueError:
+                            pass
                 self._migrate()
+                if legacy:
+                    self.save()
         except Exception:
             pass
 
@@ -346,6 +370,37 @@ class SettingsManager:
     def get(self, key, default=None):
         return self._settings.get(key, default)
 
+    def get_int_clamped(self, key: str, default: int, lo: int, hi: int) -> int:
+        """int(setting) clamped to [lo, hi]; memoized until the next update()."""
+        cache_key = (key, int, default, lo, hi)
+        try:
+            return self._clamped[cache_key]
+        except KeyError:
+            pass
+        try:
+            value = int(self._settings.get(key, default))
+        except (TypeError, ValueError):
+            value = default
+        value = max(lo, min(value, hi))
+        self._clamped[cache_key] = value
+        return value
+
+    def get_float_clamped(self, key: str, default: float, lo: float, hi: float) -> float:
+        """float(setting) clamped to [lo, hi]; memoized until the next update()."""
+        cache_key = (key, float, default, lo, hi)
+        try:
+            return self._clamped[cache_key]
+        except KeyError:
+            pass
+        try:
+            value = float(self._settings.get(key, default))
+        except (TypeError, ValueError):
+            value = default
+        value = max(lo, min(value, hi))
+        self._clamped[cache_key] = value
+        return value
+
     def update(self, new_settings: dict):
         self._settings.update(new_settings)
+        self._clamped.clear()
         self.save()
@@ -32,6 +32,7 @@ MODEL_CATALOG = [
     # Parakeet – always local via onnx-asr
     {"name": "parakeet-tdt-0.6b-v3",      "category": "parakeet", "device": "any"},
     {"name": "parakeet-tdt-0.6b-v3-fp32", "category": "parakeet", "device": "any"},
+    {"name": "parakeet-tdt-0.6b-v3-int8", "category": "parakeet", "device": "any"},
 ]
 
 API_WHISPER_MODELS = {
@@ -2,7 +2,7 @@ from PyQt6 import QtCore, QtGui, QtWidgets
 
 from theme import normalize_theme, theme_colors
 
-NOTIFICATION_ANCHORS = {
+NOTIFICATION_ANCHORS = frozenset({
     "bottom_right",
     "bottom_left",
     "top_right",
@@ -11,12 +11,15 @@ NOTIFICATION_ANCHORS = {
     "bottom_center",
     "left_center",
     "right_center",
-}
+})
+DEFAULT_ANCHOR = "bottom_right"
 
 
 def normalize_anchor(anchor: str) -> str:
-    key = str(anchor or "bottom_right").strip().lower()
-    return key if key in NOTIFICATION_ANCHORS else "bottom_right"
+    if anchor in NOTIFICATION_ANCHORS:
+        return anchor
+    key = str(anchor or DEFAULT_ANCHOR).strip().lower()
+    return key if key in NOTIFICATION_ANCHORS else DEFAULT_ANCHOR
 
 
 def anchored_position(
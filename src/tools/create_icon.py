@@ -1,65 +1,70 @@
 from pathlib import Path
 
-from PIL import Image, ImageDraw
+import numpy as np
+from PIL import Image
 
+_ICON_SIZES = (16, 24, 32, 48, 64, 128, 256)
+_PALETTE = np.array(
+    [(0, 0, 0, 0), (60, 120, 194, 255), (255, 255, 255, 255)],
+    dtype=np.uint8,
+)
 
-def _draw_icon(size: int) -> Image.Image:
-    image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(image)
 
-    margin = max(2, int(size * 0.03))
-    draw.ellipse(
-        (margin, margin, size - margin - 1, size - margin - 1),
-        fill=(60, 120, 194, 255),
-    )
+def _rounded_rect_mask(xx, yy, box, radius: float):
+    # Pixel centres within `radius` of the rectangle shrunk by `radius`.
+    left, top, right, bottom = box
+    # Inclusive pixel box -> continuous edges.
+    right += 1
+    bottom += 1
+    radius = min(float(radius), (right - left) / 2.0, (bottom - top) / 2.0)
+    dx = np.maximum(np.maximum((left + radius) - xx, xx - (right - radius)), 0.0)
+    dy = np.maximum(np.maximum((top + radius) - yy, yy - (bottom - radius)), 0.0)
+    return (dx * dx + dy * dy) <= radius * radius
 
-    fg = (255, 255, 255, 255)
 
-    capsule_left = int(size * 0.34)
-    capsule_top = int(size * 0.16)
-    capsule_right = int(size * 0.66)
-    capsule_bottom = int(size * 0.63)
-    capsule_radius = max(2, int(size * 0.16))
-    draw.rounded_rectangle(
-        (capsule_left, capsule_top, capsule_right, capsule_bottom),
-        radius=capsule_radius,
-        fill=fg,
-    )
+def _draw_icon(size: int) -> Image.Image:
+    # One vectorised pass per shape over pixel centres instead of ImageDraw calls.
+    yy, xx = np.mgrid[0:size, 0:size].astype(np.float32) + 0.5
 
-    stem_left = int(size * 0.42)
-    stem_top = int(size * 0.63)
-    stem_right = int(size * 0.58)
-    stem_bottom = int(size * 0.84)
-    stem_radius = max(1, int(size * 0.05))
-    draw.rounded_rectangle(
-        (stem_left, stem_top, stem_right, stem_bottom),
-        radius=stem_radius,
-        fill=fg,
-    )
+    margin = max(2, int(size * 0.03))
+    extent = size - margin - 1
+    circle = _rounded_rect_mask(xx, yy, (margin, margin, extent, extent), size)
 
-    base_left = int(size * 0.31)
-    base_top = int(size * 0.86)
-    base_right = int(size * 0.69)
-    base_bottom = int(size * 0.95)
-    base_radius = max(1, int(size * 0.05))
-    draw.rounded_rectangle(
-        (base_left, base_top, base_right, base_bottom),
-        radius=base_radius,
-        fill=fg,
+    capsule = (int(size * 0.34), int(size * 0.16), int(size * 0.66), int(size * 0.63))
+    stem = (int(size * 0.42), int(size * 0.63), int(size * 0.58), int(size * 0.84))
+    base = (int(size * 0.31), int(size * 0.86), int(size * 0.69), int(size * 0.95))
+    mic = (
+        _rounded_rect_mask(xx, yy, capsule, max(2, int(size * 0.16)))
+        | _rounded_rect_mask(xx, yy, stem, max(1, int(size * 0.05)))
+        | _rounded_rect_mask(xx, yy, base, max(1, int(size * 0.05)))
     )
 
-    return image
+    # Only two colours: index each pixel (0 clear, 1 disc, 2 mic) and expand
+    # through the palette, so the RGBA buffer is written once.
+    shade = circle.astype(np.uint8)
+    shade[mic] = 2
+    buf = _PALETTE[shade]
+
+    return Image.fromarray(buf, "RGBA")
 
 
 def main() -> None:
     out_path = Path("src") / "assets" / "smolstt.ico"
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Render each size once: large ones are drawn natively, small ones are
+    # downsampled from the 256 px master with LANCZOS. Handing them over via
+    # append_images stops the ICO writer from resizing the master per size.
     base = _draw_icon(256)
+    variants = [
+        _draw_icon(s) if s >= 64 else base.resize((s, s), Image.Resampling.LANCZOS)
+        for s in _ICON_SIZES[:-1]
+    ]
     base.save(
         out_path,
         format="ICO",
-        sizes=[(16, 16), (24, 24), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)],
+        sizes=[(s, s) for s in _ICON_SIZES],
+        append_images=variants,
     )
     print(f"Wrote {out_path}")
 
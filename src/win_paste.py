@@ -0,0 +1,148 @@
+import ctypes
+import sys
+import time
+
+from logger import log
+
+_CF_UNICODETEXT = 13
+_GMEM_MOVEABLE = 0x0002
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_VK_CONTROL = 0x11
+_VK_V = 0x56
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member; it has to be present so that
+    # sizeof(INPUT) matches what SendInput expects.
+    _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("u", _INPUTUNION)]
+
+
+def _key(vk: int, up: bool = False) -> _INPUT:
+    event = _INPUT(type=_INPUT_KEYBOARD)
+    event.u.ki = _KEYBDINPUT(wVk=vk, dwFlags=_KEYEVENTF_KEYUP if up else 0)
+    return event
+
+
+# Ctrl down, V down, V up, Ctrl up — built once, reused for every paste.
+_CTRL_V = (_INPUT * 4)(
+    _key(_VK_CONTROL),
+    _key(_VK_V),
+    _key(_VK_V, up=True),
+    _key(_VK_CONTROL, up=True),
+)
+
+
+# Key-ups that undo a partial injection, indexed by how many events got through.
+_RELEASE_AFTER = {
+    1: (_INPUT * 1)(_key(_VK_CONTROL, up=True)),
+    2: (_INPUT * 2)(_key(_VK_V, up=True), _key(_VK_CONTROL, up=True)),
+    3: (_INPUT * 1)(_key(_VK_CONTROL, up=True)),
+}
+
+
+def send_ctrl_v() -> bool:
+    """Inject Ctrl+V with one SendInput call. Returns False if it was not fully sent."""
+    if sys.platform != "win32":
+        return False
+    try:
+        user32 = ctypes.windll.user32
+        sent = user32.SendInput(len(_CTRL_V), _CTRL_V, ctypes.sizeof(_INPUT))
+    except Exception as exc:
+        log.debug("SendInput unavailable: %s", exc)
+        return False
+    if sent == len(_CTRL_V):
+        return True
+    # 0 means the input was blocked (e.g. UIPI); let the caller retry another way.
+    log.warning("SendInput injected %d of %d paste events", sent, len(_CTRL_V))
+    release = _RELEASE_AFTER.get(sent)
+    if release is not None:
+        # Don't leave Ctrl (or V) held down after a partial injection.
+        user32.SendInput(len(release), release, ctypes.sizeof(_INPUT))
+    return False
+
+
+_clip_api = None
+
+
+def _clipboard_api():
+    # Private WinDLL handles so argtypes set here don't leak into the shared
+    # ctypes.windll function objects that pyperclip also configures.
+    global _clip_api
+    if _clip_api is None:
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        user32.OpenClipboard.argtypes = [ctypes.c_void_p]
+        user32.SetClipboardData.argtypes = [ctypes.c_uint, ctypes.c_void_p]
+        user32.SetClipboardData.restype = ctypes.c_void_p
+        kernel32.GlobalAlloc.argtypes = [ctypes.c_uint, ctypes.c_size_t]
+        kernel32.GlobalAlloc.restype = ctypes.c_void_p
+        kernel32.GlobalLock.argtypes = [ctypes.c_void_p]
+        kernel32.GlobalLock.restype = ctypes.c_void_p
+        kernel32.GlobalUnlock.argtypes = [ctypes.c_void_p]
+        kernel32.GlobalFree.argtypes = [ctypes.c_void_p]
+        _clip_api = (user32, kernel32)
+    return _clip_api
+
+
+def set_clipboard_text(text: str) -> bool:
+    """Put `text` on the clipboard as CF_UNICODETEXT. Returns False if it could not."""
+    if sys.platform != "win32":
+        return False
+    try:
+        user32, kernel32 = _clipboard_api()
+    except Exception as exc:
+        log.debug("Clipboard API unavailable: %s", exc)
+        return False
+    data = text.encode("utf-16-le") + b"\x00\x00"
+    # Another process may hold the clipboard for a moment.
+    for _ in range(10):
+        if user32.OpenClipboard(None):
+            break
+        time.sleep(0.01)
+    else:
+        log.warning("Could not open clipboard")
+        return False
+    try:
+        user32.EmptyClipboard()
+        handle = kernel32.GlobalAlloc(_GMEM_MOVEABLE, len(data))
+        if not handle:
+            return False
+        ptr = kernel32.GlobalLock(handle)
+        if not ptr:
+            kernel32.GlobalFree(handle)
+            return False
+        ctypes.memmove(ptr, data, len(data))
+        kernel32.GlobalUnlock(handle)
+        if not user32.SetClipboardData(_CF_UNICODETEXT, handle):
+            # Ownership only passes to the system on success.
+            kernel32.GlobalFree(handle)
+            return False
+        return True
+    finally:
+        user32.CloseClipboard()
@@ -0,0 +1,69 @@
+import os
+import sys
+import textwrap
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import local_inference  # noqa: E402
+
+# Stand-in faster_whisper: each path reports which call served it, and the
+# batched pipeline fails without VAD like faster-whisper >= 1.1 does on long clips.
+_FAKE_FASTER_WHISPER = textwrap.dedent(
+    """
+    class _Segment:
+        def __init__(self, text):
+            self.text = text
+
+    def download_model(model_id, local_files_only=False):
+        return model_id
+
+    class WhisperModel:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def transcribe(self, audio, **kwargs):
+            return [_Segment("sequential vad=%s" % kwargs.get("vad_filter"))], None
+
+    class BatchedInferencePipeline:
+        def __init__(self, model):
+            self.model = model
+
+        def transcribe(self, audio, batch_size=16, **kwargs):
+            if not kwargs.get("vad_filter"):
+                raise RuntimeError("No clip timestamps found. Set 'vad_filter' to True or provide 'clip_timestamps'.")
+            return [_Segment("batched vad=True")], None
+    """
+)
+
+
+@pytest.fixture
+def fake_env(tmp_path):
+    pkg = tmp_path / "faster_whisper"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text(_FAKE_FASTER_WHISPER)
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(tmp_path)
+    return env
+
+
+@pytest.mark.parametrize(
+    "vad_filter, expected",
+    [(True, "batched vad=True"), (False, "sequential vad=False")],
+)
+def test_cuda_worker_batches_only_with_vad(fake_env, vad_filter, expected):
+    worker = local_inference._InferenceWorker("whisper", "tiny", "cuda", "auto", "{}", fake_env)
+    try:
+        assert worker.run(b"RIFF", {"vad_filter": vad_filter, "beam_size": 1}, timeout=30) == expected
+    finally:
+        worker.stop()
+
+
+def test_one_worker_serves_different_decode_options(fake_env):
+    worker = local_inference._InferenceWorker("whisper", "tiny", "cuda", "auto", "{}", fake_env)
+    try:
+        assert worker.run(b"RIFF", {"vad_filter": True}, timeout=30) == "batched vad=True"
+        assert worker.run(b"RIFF", {"vad_filter": False}, timeout=30) == "sequential vad=False"
+    finally:
+        worker.stop()